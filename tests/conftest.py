@@ -0,0 +1,6 @@
+import os
+import sys
+
+# transcript.py refuses to load without a token; the tests never talk to Telegram.
+os.environ.setdefault("BOT_TOKEN", "test-token")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,108 @@
+"""
+Differential test for the counting engine: the literal prefilter, folded
+patterns and fused scanner must give exactly the counts of the plain
+per-category regexes (findall with IGNORECASE on the lowered text).
+"""
+import random
+import re
+
+import pytest
+
+import transcript
+
+WORDS = (
+    "dollar dollars dollar's $100 $ 5 $five thousand millions billion's challenge "
+    "challenges eliminated trap traps trapdoor deathtrap booby-trap booby trap car "
+    "supercar cars racecar tesla lamborghini's helicopter jet jets jetski island "
+    "islands mystery box mystery boxes massive world's biggest worlds largest world "
+    "biggest beast games beast game feastables feastable mrbeast mr. beast mr "
+    "beast's insane subscribe subscribes cocoa chocolate good goods goodness "
+    "goodwill goodbye good-natured goodly america americans un-american american's "
+    "dude dudes president presidents administration peace war wars warfare civil "
+    "addiction drugs drug-free drugstore criminal criminalize criminals amen amens "
+    "kiss kisses kissed ufo UFOs U.F.O. u f o alien aliens truth truths black and "
+    "white black-and-white prime minister ministers donald trump trump's trumps "
+    "bernie sanders hillary clinton clintons aoc a.o.c. a o c obama obama's hello "
+    "the a of and to in it अवंतिका Ǳ"
+).split()
+
+# Characters whose lower() / IGNORECASE behaviour differs from plain ASCII
+# folding: dotless ı, long ſ, dotted İ (lowers to two code points), Kelvin K.
+TRICKY = ["ı", "ſ", "İ", "K", "dıme", "ſubscribe", "İnsane", "Kiss", "tıme"]
+
+SEPARATORS = [" ", " ", " ", ", ", ". ", "\n", "-", "'", "!"]
+
+MARKETS = [key for key, cfg in transcript.MARKET_CONFIGS.items() if cfg.get("word_groups")]
+
+
+def corpus(seed: int, n: int, tricky: bool) -> str:
+    rnd   = random.Random(seed)
+    vocab = WORDS + TRICKY if tricky else WORDS
+    out   = []
+    for _ in range(n):
+        word = rnd.choice(vocab)
+        roll = rnd.random()
+        if roll < 0.2:
+            word = word.upper()
+        elif roll < 0.4:
+            word = word.capitalize()
+        out.append(word)
+        out.append(rnd.choice(SEPARATORS))
+    return "".join(out)
+
+
+def reference_count(text_lower: str, spec: tuple) -> int:
+    if spec[0] == "simple":
+        return len(re.findall(spec[1], text_lower, re.IGNORECASE))
+    _, full_pat, fallback_pat = spec
+    full     = re.findall(full_pat, text_lower, re.IGNORECASE)
+    scrubbed = re.sub(full_pat, "XXFULLNAMEXX", text_lower, flags=re.IGNORECASE)
+    return len(full) + len(re.findall(fallback_pat, scrubbed, re.IGNORECASE))
+
+
+TEXTS = (
+    [corpus(seed, 2000, tricky=False) for seed in range(10)]
+    + [corpus(seed, 300, tricky=True) for seed in range(10, 60)]
+    + ["", "Hello", "DOLLAR$", "mr.beast", "ſ", "ı", "İ", "Kiss", "ASCII only dollar dollars"]
+)
+
+
+@pytest.mark.parametrize("market_key", MARKETS)
+@pytest.mark.parametrize("text", TEXTS, ids=range(len(TEXTS)))
+def test_engine_matches_plain_findall(market_key, text):
+    text_lower = text.lower()
+    groups     = transcript.MARKET_CONFIGS[market_key]["word_groups"]
+    expected   = {cat: reference_count(text_lower, spec) for cat, spec in groups.items()}
+
+    prefilter = transcript.literal_prefilter_ok(text_lower)
+    compiled  = transcript.COMPILED_GROUPS[market_key]
+    assert transcript.count_categories(text_lower, compiled, prefilter) == expected
+    assert transcript.count_categories(text_lower, compiled, False) == expected
+    for cat, spec in compiled:
+        assert transcript.count_matches(text_lower, spec, prefilter) == expected[cat], cat
+
+
+@pytest.mark.parametrize("market_key", MARKETS)
+def test_count_transcript_lowers_like_the_reference(market_key):
+    text     = corpus(99, 500, tricky=True)
+    groups   = transcript.MARKET_CONFIGS[market_key]["word_groups"]
+    expected = {cat: reference_count(text.lower(), spec) for cat, spec in groups.items()}
+    assert transcript.count_transcript(text, market_key) == expected
+    assert transcript.count_transcript(text, market_key) == expected   # memoised path
+
+
+@pytest.mark.parametrize("market_key", MARKETS)
+def test_short_texts_reuse_one_fused_scanner(market_key):
+    # The prefilter prunes a different category subset per text; that must
+    # not change which scanner is compiled (one per market and variant).
+    compiled = transcript.COMPILED_GROUPS[market_key]
+    for seed in range(5):                                   # warm both variants
+        text_lower = corpus(seed, 40, tricky=seed % 2 == 1).lower()
+        transcript.count_categories(text_lower, compiled, transcript.literal_prefilter_ok(text_lower))
+    before = transcript.fused_scanner.cache_info()
+    for seed in range(100, 300):
+        text_lower = corpus(seed, 40, tricky=seed % 2 == 1).lower()
+        transcript.count_categories(text_lower, compiled, transcript.literal_prefilter_ok(text_lower))
+    after = transcript.fused_scanner.cache_info()
+    assert after.misses == before.misses
+    assert after.hits - before.hits == 200
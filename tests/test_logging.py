@@ -0,0 +1,16 @@
+"""The bot's logging setup stays off the root logger."""
+import logging
+
+import transcript
+
+
+def test_handler_is_scoped_to_the_sniper_logger():
+    assert transcript.logger.name == "sniper"
+    assert transcript._log_handler in transcript.logger.handlers
+    assert transcript.logger.propagate is False
+    assert transcript._log_handler not in logging.getLogger().handlers
+
+
+def test_debug_level_does_not_reach_library_loggers():
+    assert transcript.logger.level == logging.getLevelNamesMapping()[transcript.LOG_LEVEL]
+    assert logging.getLogger("urllib3").getEffectiveLevel() == logging.getLogger().level
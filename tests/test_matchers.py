@@ -0,0 +1,100 @@
+"""
+Polymarket question → category, per market.  The expected categories are
+those of the original if/elif ladders, including overlaps they resolved by
+position (e.g. "Mystery Box" or "Beast Games" → Beast Games).
+"""
+import pytest
+
+import transcript
+
+MRBEAST = [
+    ('Will MrBeast say "Beast Games" during his next YouTube video?', "Beast Games"),
+    ('Will MrBeast say "Mystery Box" during his next YouTube video?', "Mystery Box"),
+    ('Will MrBeast say "World\'s Biggest" or "World\'s Largest" during his next YouTube video?', "World's Biggest/Largest"),
+    ('Will MrBeast say "Tesla" or "Lamborghini" during his next YouTube video?', "Tesla/Lamborghini"),
+    ('Will MrBeast say "Lamborghini" during his next YouTube video?', "Tesla/Lamborghini"),
+    ('Will MrBeast say "Helicopter" or "Jet" during his next YouTube video?', "Helicopter/Jet"),
+    ('Will MrBeast say "Thousand" or "Million" 10+ times during his next YouTube video?', "Thousand/Million"),
+    ('Will MrBeast say "Dollar" 10+ times during his next YouTube video?', "Dollar"),
+    ('Will MrBeast say "Subscribe" during his next YouTube video?', "Subscribe"),
+    ('Will MrBeast say "Insane" during his next YouTube video?', "Insane"),
+    ('Will MrBeast say "Feastables" during his next YouTube video?', "Feastables"),
+    ('Will MrBeast say "Cocoa" 3+ times during his next YouTube video?', "Cocoa"),
+    ('Will MrBeast say "Chocolate" 3+ times during his next YouTube video?', "Chocolate"),
+    ('Will MrBeast say "MrBeast" during his next YouTube video?', "MrBeast"),
+    ('Will MrBeast say "Mr Beast" during his next YouTube video?', "MrBeast"),
+    ('Will MrBeast say "Eliminated" during his next YouTube video?', "Eliminated"),
+    ('Will MrBeast say "Challenge" during his next YouTube video?', "Challenge"),
+    ('Will MrBeast say "Massive" during his next YouTube video?', "Massive"),
+    ('Will MrBeast say "Island" during his next YouTube video?', "Island"),
+    ('Will MrBeast say "Trap" during his next YouTube video?', "Trap"),
+    ('Will MrBeast say "Car" or "Supercar" during his next YouTube video?', "Car/Supercar"),
+    ('WILL MRBEAST SAY "INSANE" DURING HIS NEXT YOUTUBE VIDEO?', "Insane"),
+    # Overlaps: the earlier rung of the old ladder wins
+    ('Will MrBeast say "Mystery Box" or "Beast Games" during his next YouTube video?', "Beast Games"),
+    ('Will MrBeast say "Thousand Dollars" during his next YouTube video?', "Thousand/Million"),
+    ('Will MrBeast say "Million Dollar" during his next YouTube video?', "Thousand/Million"),
+    ('Will MrBeast say "Car Trap" during his next YouTube video?', "Trap"),
+    ('Will MrBeast say "Chocolate Island" during his next YouTube video?', "Chocolate"),
+    ('Will MrBeast say "Jetski" during his next YouTube video?', "Helicopter/Jet"),
+    # No "say …" term: the whole question is matched, so "mr"+"beast" wins
+    ("MrBeast next video: Massive?", "MrBeast"),
+    ("Will MrBeast upload a video this week?", "MrBeast"),
+    ('Will MrBeast say "Hello" during his next YouTube video?', None),
+]
+
+JOEROGAN = [
+    ('Will Joe Rogan say "Good" 20+ times during the first JRE episode of the week?', "Good"),
+    ('Will Joe Rogan say "America" or "American" 10+ times during the first JRE episode of the week?', "America/American"),
+    ('Will Joe Rogan say "Dude" 10+ times during the first JRE episode of the week?', "Dude"),
+    ('Will Joe Rogan say "President" or "Administration" 3+ times during the first JRE episode of the week?', "President/Admin"),
+    ('Will Joe Rogan say "Peace" or "War" 3+ times during the first JRE episode of the week?', "Peace/War"),
+    ('Will Joe Rogan say "Prime Minister" during the first JRE episode of the week?', "Prime Minister"),
+    ('Will Joe Rogan say "Black and White" during the first JRE episode of the week?', "Black and White"),
+    ('Will Joe Rogan say "Addiction" or "Drug" during the first JRE episode of the week?', "Addiction/Drug"),
+    ('Will Joe Rogan say "Criminal" or "Criminalize" during the first JRE episode of the week?', "Criminal/Criminalize"),
+    ('Will Joe Rogan say "Amen" during the first JRE episode of the week?', "Amen"),
+    ('Will Joe Rogan say "Kiss" during the first JRE episode of the week?', "Kiss"),
+    ('Will Joe Rogan say "UFO" or "Alien" during the first JRE episode of the week?', "UFO/Alien"),
+    ('Will Joe Rogan say "Truth" during the first JRE episode of the week?', "Truth"),
+    ('Will Joe Rogan say "Donald Trump" during the first JRE episode of the week?', "Donald/Trump"),
+    ('Will Joe Rogan say "Trump" during the first JRE episode of the week?', "Donald/Trump"),
+    ('Will Joe Rogan say "Bernie Sanders" during the first JRE episode of the week?', "Bernie/Sanders"),
+    ('Will Joe Rogan say "Hillary Clinton" during the first JRE episode of the week?', "Hillary/Clinton"),
+    ('Will Joe Rogan say "AOC" during the first JRE episode of the week?', "AOC"),
+    ('Will Joe Rogan say "Obama" during the first JRE episode of the week?', "Obama"),
+    # Peace/War without a "3" falls through to the last rung
+    ('Will Joe Rogan say "War" during the first JRE episode of the week?', "Peace/War"),
+    ('Will Joe Rogan say "Peace" during the first JRE episode of the week?', "Peace/War"),
+    # Overlaps and count-digit rules, resolved by ladder position
+    ('Will Joe Rogan say "President Trump" 3+ times during the first JRE episode of the week?', "President/Admin"),
+    ('Will Joe Rogan say "Trump" or "Obama" during the first JRE episode of the week?', "Donald/Trump"),
+    ('Will Joe Rogan say "Alien" or "Truth" during the first JRE episode of the week?', "UFO/Alien"),
+    ('Will Joe Rogan say "Trump" during the first JRE episode of the week of March 3?', "Donald/Trump"),
+    ('Will Joe Rogan say "Kiss" during the first JRE episode of 2025?', "Kiss"),
+    ('Will Joe Rogan say "Good" during the first JRE episode of 2025?', "Good"),   # "20" in 2025
+    ('Will Joe Rogan say "Good" during the first JRE episode of the week?', None),
+    ('Will Joe Rogan say "Hello" during the first JRE episode of the week?', None),
+]
+
+
+@pytest.mark.parametrize("question, expected", MRBEAST)
+def test_match_market_mrbeast(question, expected):
+    assert transcript.match_market_mrbeast(question) == expected
+
+
+@pytest.mark.parametrize("question, expected", JOEROGAN)
+def test_match_market_joerogan(question, expected):
+    assert transcript.match_market_joerogan(question) == expected
+
+
+@pytest.mark.parametrize("market_key", ["mrbeast", "joerogan"])
+def test_every_category_is_reachable(market_key):
+    table    = MRBEAST if market_key == "mrbeast" else JOEROGAN
+    expected = {cat for _, cat in table if cat}
+    assert expected == set(transcript.MARKET_CONFIGS[market_key]["word_groups"])
+
+
+@pytest.mark.parametrize("market_key", ["mychannel", "souravjoshi"])
+def test_testing_markets_match_nothing(market_key):
+    assert transcript.MARKET_MATCHERS[market_key](MRBEAST[0][0]) is None
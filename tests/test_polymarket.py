@@ -0,0 +1,193 @@
+"""
+get_polymarket_data caching: TTL hits, coalesced in-flight fetches, the
+CLOB /midpoints price refresh and If-None-Match reuse, against a fake
+SESSION.request.
+"""
+import json
+import threading
+
+import pytest
+
+import transcript
+
+SLUG = "what-will-mrbeast-say-during-his-next-youtube-video"
+
+EVENT = {"markets": [
+    {"question": 'Will MrBeast say "Dollar" 10+ times during his next YouTube video?',
+     "outcomePrices": '["0.40", "0.60"]', "outcomes": '["Yes", "No"]',
+     "clobTokenIds": '["dollar-yes", "dollar-no"]'},
+    {"question": 'Will MrBeast say "Insane" during his next YouTube video?',
+     "outcomePrices": '["0.70", "0.30"]', "outcomes": '["Yes", "No"]',
+     "clobTokenIds": '["insane-yes", "insane-no"]'},
+]}
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=None, headers=None):
+        self.status_code = status_code
+        self.content     = json.dumps(body).encode() if body is not None else b""
+        self.headers     = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """Records calls; `routes` maps method → callable(url, kwargs) → FakeResponse."""
+
+    def __init__(self, **routes):
+        self.calls  = []
+        self.routes = routes
+
+    def request(self, method, url, timeout=None, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.routes[method](url, kwargs)
+
+    def count(self, method):
+        return sum(1 for m, _, _ in self.calls if m == method)
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    for store in (transcript._poly_cache, transcript._poly_inflight, transcript._poly_etags):
+        store.clear()
+    yield
+    for store in (transcript._poly_cache, transcript._poly_inflight, transcript._poly_etags):
+        store.clear()
+
+
+def install(monkeypatch, **routes):
+    session = FakeSession(**routes)
+    monkeypatch.setattr(transcript.SESSION, "request", session.request)
+    return session
+
+
+def fetch():
+    return transcript.get_polymarket_data(SLUG, transcript.match_market_mrbeast, None)
+
+
+def expire(meta_too=False):
+    expires_at, data, meta_expires = transcript._poly_cache[SLUG]
+    transcript._poly_cache[SLUG] = (0.0, data, 0.0 if meta_too else meta_expires)
+
+
+def test_fresh_hit_reuses_the_fetch(monkeypatch):
+    session = install(monkeypatch, GET=lambda url, kw: FakeResponse(body=EVENT))
+    prices, token_ids = fetch()
+    assert prices == {"Dollar": 0.40, "Insane": 0.70}
+    assert token_ids["Dollar"] == {"yes": "dollar-yes", "no": "dollar-no"}
+    assert fetch() == (prices, token_ids)
+    assert session.count("GET") == 1
+
+
+def test_expired_prices_refresh_from_midpoints(monkeypatch):
+    mids = {"dollar-yes": "0.45", "insane-yes": "0.65"}
+    session = install(monkeypatch,
+                      GET=lambda url, kw: FakeResponse(body=EVENT),
+                      POST=lambda url, kw: FakeResponse(body=mids))
+    _, token_ids = fetch()
+    expire()
+    prices, refreshed_ids = fetch()
+    assert prices == {"Dollar": 0.45, "Insane": 0.65}
+    assert refreshed_ids is token_ids
+    assert session.count("GET") == 1
+    method, url, kwargs = session.calls[-1]
+    assert url.endswith("/midpoints")
+    assert sorted(d["token_id"] for d in kwargs["json"]) == ["dollar-yes", "insane-yes"]
+
+
+def test_expired_metadata_triggers_full_refetch(monkeypatch):
+    session = install(monkeypatch, GET=lambda url, kw: FakeResponse(body=EVENT))
+    fetch()
+    expire(meta_too=True)
+    fetch()
+    assert session.count("GET") == 2
+    assert session.count("POST") == 0
+
+
+def test_failed_midpoint_refresh_falls_back_to_full_refetch(monkeypatch):
+    session = install(monkeypatch,
+                      GET=lambda url, kw: FakeResponse(body=EVENT),
+                      POST=lambda url, kw: FakeResponse(status_code=500))
+    first = fetch()
+    expire()
+    assert fetch() == first
+    assert session.count("POST") == 1
+    assert session.count("GET") == 2
+
+
+def test_concurrent_callers_share_one_fetch(monkeypatch):
+    entered, release = threading.Event(), threading.Event()
+
+    def slow_get(url, kw):
+        entered.set()
+        assert release.wait(5)
+        return FakeResponse(body=EVENT)
+
+    session = install(monkeypatch, GET=slow_get)
+    results = []
+    first   = threading.Thread(target=lambda: results.append(fetch()))
+    first.start()
+    assert entered.wait(5)
+    second  = threading.Thread(target=lambda: results.append(fetch()))
+    second.start()
+    second.join(0.2)
+    assert second.is_alive()                            # parked on the in-flight Future
+    release.set()
+    first.join(5)
+    second.join(5)
+    assert len(results) == 2 and results[0] == results[1]
+    assert session.count("GET") == 1
+    assert not transcript._poly_inflight
+
+
+class Boom(BaseException):
+    """Not an Exception, so _fetch_polymarket_data can't swallow it."""
+
+
+def test_fetch_exception_reaches_waiters(monkeypatch):
+    entered, release = threading.Event(), threading.Event()
+
+    def failing_fetch(slug, match_fn, word_groups):
+        entered.set()
+        assert release.wait(5)
+        raise Boom
+
+    monkeypatch.setattr(transcript, "_fetch_polymarket_data", failing_fetch)
+    errors = []
+
+    def call():
+        try:
+            fetch()
+        except Boom as e:
+            errors.append(type(e))
+
+    first = threading.Thread(target=call)
+    first.start()
+    assert entered.wait(5)
+    waiter = threading.Thread(target=call)
+    waiter.start()
+    waiter.join(0.2)
+    assert waiter.is_alive()
+    release.set()
+    first.join(5)
+    waiter.join(5)
+    assert errors == [Boom, Boom]
+    assert not transcript._poly_inflight
+    assert SLUG not in transcript._poly_cache
+
+
+def test_not_modified_reuses_the_etag_body(monkeypatch):
+    def get(url, kw):
+        if (kw.get("headers") or {}).get("If-None-Match") == '"v1"':
+            return FakeResponse(status_code=304, headers={"ETag": '"v1"'})
+        return FakeResponse(body=EVENT, headers={"ETag": '"v1"'})
+
+    session = install(monkeypatch, GET=get)
+    first = fetch()
+    expire(meta_too=True)
+    assert fetch() == first
+    assert session.calls[0][2].get("headers") is None
+    assert session.calls[1][2]["headers"] == {"If-None-Match": '"v1"'}
+    assert session.count("GET") == 2
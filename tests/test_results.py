@@ -0,0 +1,110 @@
+"""Delivering results to Telegram: splitting, send fallbacks, render failures."""
+import re
+from concurrent.futures import Future
+
+import pytest
+
+import transcript
+
+MARKET = "mrbeast"
+
+
+class FakeBot:
+    """Records messages; `fail` is how many send/edit calls to reject first."""
+
+    def __init__(self, fail=0, fail_edit=False):
+        self.sent, self.edited = [], []
+        self.fail, self.fail_edit = fail, fail_edit
+
+    def send_message(self, chat_id, text, parse_mode=None):
+        if self.fail:
+            self.fail -= 1
+            raise RuntimeError("Bad Request: message is too long")
+        self.sent.append(text)
+        return type("Msg", (), {"message_id": len(self.sent)})()
+
+    def edit_message_text(self, text, chat_id, message_id, parse_mode=None):
+        if self.fail_edit:
+            raise RuntimeError("Bad Request: message to edit not found")
+        self.edited.append(text)
+
+
+@pytest.fixture
+def counts():
+    return transcript.count_transcript("dollar dollar insane", MARKET)
+
+
+def balanced(part):
+    return re.findall(r"</?pre>", part) in ([], ["<pre>", "</pre>"] * (part.count("<pre>")))
+
+
+def long_result(counts, lines=400):
+    trades = "".join(f"trade {i:<30} Yes 0.40  ~150%\n" for i in range(lines))
+    return (f"<b>Polymarket Sniper 🚀</b>\n\n{transcript.format_counts(MARKET, counts)}"
+            f"\n<b>🤖 Trades</b>\n<pre>{trades}</pre>")
+
+
+def test_split_keeps_every_line_under_the_limit(counts):
+    text  = long_result(counts)
+    parts = transcript.split_message(text, limit=500)
+    assert len(parts) > 1
+    assert all(len(p) <= 500 for p in parts)
+    assert all(balanced(p) for p in parts)
+    rejoined = "".join(parts).replace("</pre><pre>", "")
+    assert rejoined == text
+
+
+def test_split_short_text_is_one_part():
+    assert transcript.split_message("<b>hi</b>\n<pre>x\n</pre>") == ["<b>hi</b>\n<pre>x\n</pre>"]
+    assert transcript.split_message("") == []
+
+
+def test_split_hard_cuts_an_overlong_line():
+    parts = transcript.split_message("<pre>\n" + "x" * 1000 + "\n</pre>", limit=100)
+    assert all(len(p) <= 100 and balanced(p) for p in parts)
+    assert "".join(parts).replace("</pre><pre>", "").count("x") == 1000
+
+
+def test_rejected_result_is_sent_in_parts_under_the_limit(monkeypatch, counts):
+    bot = FakeBot(fail=1)
+    monkeypatch.setattr(transcript, "bot", bot)
+    transcript.send_results(1, MARKET, counts, long_result(counts))
+    assert bot.sent[0] == transcript.format_counts(MARKET, counts)
+    assert len(bot.sent) > 2
+    assert all(len(p) <= transcript.TELEGRAM_MSG_LIMIT for p in bot.sent)
+
+
+def test_failed_parts_are_logged_not_raised(monkeypatch, counts):
+    monkeypatch.setattr(transcript, "bot", FakeBot(fail=10**6))
+    transcript.send_results(1, MARKET, counts, long_result(counts))
+
+
+def test_sync_reply_survives_render_and_send_failures(monkeypatch):
+    def boom(*args):
+        raise RuntimeError("render failed")
+    monkeypatch.setattr(transcript, "start_polymarket_fetch", lambda key: None)
+    monkeypatch.setattr(transcript, "render_results", boom)
+    bot = FakeBot()
+    monkeypatch.setattr(transcript, "bot", bot)
+    transcript.reply_with_results(1, "dollar", MARKET)
+    assert "Could not build" in bot.sent[0]
+
+    monkeypatch.setattr(transcript, "bot", FakeBot(fail=10**6))
+    transcript.reply_with_results(1, "dollar", MARKET)
+
+
+@pytest.mark.parametrize("fail_edit", [False, True])
+def test_background_render_failure_replaces_the_loading_message(monkeypatch, fail_edit):
+    def boom(*args):
+        raise RuntimeError("render failed")
+    pending = Future()
+    monkeypatch.setattr(transcript, "start_polymarket_fetch", lambda key: pending)
+    monkeypatch.setattr(transcript, "render_results", boom)
+    bot = FakeBot(fail_edit=fail_edit)
+    monkeypatch.setattr(transcript, "bot", bot)
+
+    transcript.reply_with_results(1, "dollar", MARKET)
+    assert "Fetching Polymarket" in bot.sent[0]
+    pending.set_result((None, None))                    # runs the done-callback here
+    notice = bot.sent[-1] if fail_edit else bot.edited[0]
+    assert "Could not build" in notice and "Fetching" not in notice
@@ -0,0 +1,90 @@
+"""On-disk transcript cache: key validation, TTL expiry, pruning."""
+import os
+import time
+
+import pytest
+
+import transcript
+
+VIDEO = "dQw4w9WgXcQ"
+TTL = 3600
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(transcript, "TRANSCRIPT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(transcript, "TRANSCRIPT_CACHE_TTL", TTL)
+    return tmp_path
+
+
+def age(path, seconds):
+    t = time.time() - seconds
+    os.utime(path, (t, t))
+
+
+@pytest.mark.parametrize("video_id", ["", "short", VIDEO + "x", VIDEO[:10],
+                                      "../../etc/pa", "abc/def.ghi", "dQw4w9WgXc!"])
+def test_cache_path_rejects_non_video_ids(video_id):
+    assert transcript._transcript_cache_path(video_id) is None
+
+
+def test_cache_path_for_a_video_id(cache_dir):
+    assert transcript._transcript_cache_path(VIDEO) == os.path.join(str(cache_dir), VIDEO + ".txt")
+
+
+def test_ttl_zero_disables_the_cache(monkeypatch):
+    monkeypatch.setattr(transcript, "TRANSCRIPT_CACHE_TTL", 0)
+    assert transcript._transcript_cache_path(VIDEO) is None
+    transcript._write_cached_transcript(VIDEO, "hello")
+    assert transcript._read_cached_transcript(VIDEO) is None
+
+
+def test_round_trip_leaves_no_temp_files(cache_dir):
+    transcript._write_cached_transcript(VIDEO, "héllo wörld")
+    assert transcript._read_cached_transcript(VIDEO) == "héllo wörld"
+    assert os.listdir(cache_dir) == [VIDEO + ".txt"]
+
+
+def test_entry_expires_after_ttl(cache_dir, monkeypatch):
+    transcript._write_cached_transcript(VIDEO, "hello")
+    path = cache_dir / (VIDEO + ".txt")
+    written = os.path.getmtime(path)
+    monkeypatch.setattr(transcript.os.path, "getmtime", lambda p: written)
+
+    monkeypatch.setattr(transcript.time, "time", lambda: written + TTL - 1)
+    assert transcript._read_cached_transcript(VIDEO) == "hello"
+
+    monkeypatch.setattr(transcript.time, "time", lambda: written + TTL)
+    assert transcript._read_cached_transcript(VIDEO) is None
+    assert not path.exists()                            # expired entries are removed
+
+
+def test_missing_entry_is_a_miss():
+    assert transcript._read_cached_transcript(VIDEO) is None
+
+
+def test_prune_removes_stale_entries_and_temp_files(cache_dir):
+    stale_txt = cache_dir / "aaaaaaaaaaa.txt"
+    stale_tmp = cache_dir / "bbbbbbbbbbb.txt.1234.tmp"
+    fresh_txt = cache_dir / "ccccccccccc.txt"
+    fresh_tmp = cache_dir / "ddddddddddd.txt.5678.tmp"  # a write still in progress
+    for p in (stale_txt, stale_tmp, fresh_txt, fresh_tmp):
+        p.write_text("x", encoding="utf-8")
+    age(stale_txt, TTL + 60)
+    age(stale_tmp, TTL + 60)
+
+    transcript._prune_transcript_cache()
+    assert sorted(os.listdir(cache_dir)) == sorted([fresh_txt.name, fresh_tmp.name])
+
+
+def test_write_prunes_stale_entries(cache_dir):
+    stale = cache_dir / "aaaaaaaaaaa.txt.99.tmp"
+    stale.write_text("x", encoding="utf-8")
+    age(stale, TTL + 60)
+    transcript._write_cached_transcript(VIDEO, "hello")
+    assert os.listdir(cache_dir) == [VIDEO + ".txt"]
+
+
+def test_prune_tolerates_a_missing_directory(cache_dir, monkeypatch):
+    monkeypatch.setattr(transcript, "TRANSCRIPT_CACHE_DIR", str(cache_dir / "nope"))
+    transcript._prune_transcript_cache()
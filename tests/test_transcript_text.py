@@ -0,0 +1,57 @@
+"""Extracting spoken text from youtube-transcript.io payloads."""
+import pytest
+
+import transcript
+
+META = {"id": "abcdefghijk", "title": "$1,000,000 Challenge",
+        "microformat": {"playerMicroformatRenderer": {"description": {"simpleText": "Feastables"}}}}
+
+
+def payload(tracks):
+    return [dict(META, tracks=tracks)]
+
+
+def segments(*texts):
+    return [{"text": t, "start": str(i), "dur": "1.5"} for i, t in enumerate(texts)]
+
+
+def test_first_track_text_in_order():
+    data = payload([{"language": "en", "transcript": segments("one", "two", "three")},
+                    {"language": "es", "transcript": segments("uno")}])
+    assert transcript.track_transcript_text(data) == "one two three"
+    assert transcript.extract_transcript_text(data) == ("one two three", True)
+
+
+@pytest.mark.parametrize("tracks", [[], None, {}, [{"language": "en"}],
+                                    [{"language": "en", "transcript": []}], ["not-a-dict"]])
+def test_known_shape_without_captions_is_empty(tracks):
+    # Never fall back to the walk here: it would return the title/description.
+    assert transcript.track_transcript_text(payload(tracks)) == ""
+    assert transcript.extract_transcript_text(payload(tracks)) == ("", True)
+
+
+def test_malformed_segments_walk_only_the_segments():
+    data = payload([{"transcript": [{"text": "hi"}, {"start": "1"}, ["there"]]}])
+    text, from_tracks = transcript.extract_transcript_text(data)
+    assert from_tracks and text == "hi 1 there"
+    assert "Challenge" not in text
+
+
+@pytest.mark.parametrize("data", [None, [], {}, "text", [META], {"items": []}])
+def test_unknown_shape_is_not_track_text(data):
+    assert transcript.track_transcript_text(data) is None
+    assert transcript.extract_transcript_text(data)[1] is False
+
+
+def test_generic_walk_keeps_document_order():
+    data = {"items": [{"text": "a"}, [{"text": "b"}, {"nested": ["c", {"text": "d"}]}], "e"],
+            "tail": {"text": "f"}}
+    assert transcript.walk_transcript_text(data) == "a b c d e f"
+    assert transcript.extract_transcript_text(data) == ("a b c d e f", False)
+
+
+def test_walk_handles_deep_nesting():
+    data = "leaf"
+    for _ in range(5000):                               # far past the recursion limit
+        data = [data]
+    assert transcript.walk_transcript_text(data) == "leaf"
@@ -1,14 +1,46 @@
 import os
 import re
+import functools
+import hashlib
 import threading
 import time
 import json
-import hashlib
+import logging
+import sys
+import traceback
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor
 import telebot
 from telebot import types
 from ecdsa import SigningKey, SECP256k1
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from coincurve import PublicKey as CCPublicKey     # libsecp256k1 bindings
+except ImportError:
+    CCPublicKey = None
+
+try:
+    from Crypto.Hash import keccak                     # pycryptodome
+except ImportError:
+    keccak = None
+
+
+def json_loads(data):
+    """orjson when installed; stdlib for anything it rejects (e.g. >64-bit ints)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 # ─────────────────────────────────────────────
 # OPTIONAL AUTO-TRADE IMPORTS
 # ─────────────────────────────────────────────
@@ -28,6 +60,30 @@ AUTO_TRADE         = os.environ.get("AUTO_TRADE", "false").lower() == "true"
 TRADE_AMOUNT       = float(os.environ.get("TRADE_AMOUNT", "10"))
 MIN_TRADE_AMOUNT   = float(os.environ.get("MIN_TRADE_AMOUNT", "1"))
 POLL_INTERVAL      = int(os.environ.get("POLL_INTERVAL", "2"))   # seconds between checks
+POLY_TTL           = int(os.environ.get("POLY_TTL", "30"))       # seconds a Polymarket fetch is reused
+POLY_NEG_TTL       = int(os.environ.get("POLY_NEG_TTL", "10"))   # …and a failed one
+POLY_META_TTL      = int(os.environ.get("POLY_META_TTL", "300")) # token ids reused; only prices refreshed
+TRADE_CONCURRENCY  = max(1, int(os.environ.get("TRADE_CONCURRENCY", "3")))  # orders in flight at once
+BOT_THREADS        = max(1, int(os.environ.get("BOT_THREADS", "4")))        # telebot handler workers
+LOG_LEVEL          = os.environ.get("LOG_LEVEL", "INFO").upper()  # DEBUG for per-fetch detail
+TRANSCRIPT_CACHE_DIR = os.path.expanduser(os.environ.get("TRANSCRIPT_CACHE_DIR", "~/.beast_video_cache"))
+TRANSCRIPT_CACHE_TTL = int(os.environ.get("TRANSCRIPT_CACHE_TTL", "86400"))  # seconds; 0 disables
+
+# ─────────────────────────────────────────────
+# HTTP SESSION
+# One pooled keep-alive session for YouTube,
+# youtube-transcript.io and Polymarket, so calls
+# after the first skip the TCP + TLS handshake.
+# 429s are left to the callers (Retry-After /
+# key rotation); only idempotent 5xx are retried.
+# ─────────────────────────────────────────────
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3,
+                      status_forcelist=[500, 502, 503, 504], raise_on_status=False),
+))
 
 # ─────────────────────────────────────────────
 # YOUTUBE API KEY ROTATOR
@@ -114,7 +170,7 @@ if not BOT_TOKEN:
     print("ERROR: BOT_TOKEN not set!")
     exit(1)
 
-bot = telebot.TeleBot(BOT_TOKEN)
+bot = telebot.TeleBot(BOT_TOKEN, num_threads=BOT_THREADS)
 
 # ─────────────────────────────────────────────
 # CHANNEL METADATA
@@ -160,101 +216,264 @@ def is_jre_mma_episode(title: str) -> bool:
 # ─────────────────────────────────────────────
 user_state: dict[int, dict] = {}
 
+# Background workers for network calls that can overlap CPU work
+EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
 
 # ─────────────────────────────────────────────
 # LOGGING
 # ─────────────────────────────────────────────
 
-def log(msg: str):
-    import datetime
-    ts = datetime.datetime.utcnow().strftime("%H:%M:%S")
-    print(f"[{ts}] {msg}", flush=True)
+_bad_log_level = LOG_LEVEL not in logging.getLevelNamesMapping()
+if _bad_log_level:
+    LOG_LEVEL = "INFO"
+
+# Our handler and level apply to the "sniper" logger only; the root logger
+# (and with it telebot's and urllib3's output) keeps its defaults, so
+# LOG_LEVEL=DEBUG doesn't turn on per-request HTTP debugging.
+_log_formatter = logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S")
+_log_formatter.converter = time.gmtime
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(_log_formatter)
+logger = logging.getLogger("sniper")
+logger.addHandler(_log_handler)
+logger.setLevel(LOG_LEVEL)
+logger.propagate = False
+if _bad_log_level:
+    logger.warning("⚠️  Unknown LOG_LEVEL %r — using INFO.", os.environ.get("LOG_LEVEL"))
+
+
+def log(msg: str, *args):
+    """INFO line; pass values as %-style args so filtered levels skip formatting."""
+    logger.info(msg, *args)
 
 
 # ─────────────────────────────────────────────
 # HELPERS
 # ─────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=32)
 def derive_address(private_key: str) -> str:
-    pk = private_key[2:] if private_key.startswith("0x") else private_key
-    sk  = SigningKey.from_string(bytes.fromhex(pk), curve=SECP256k1)
-    vk  = sk.verifying_key
-    pub = b"\x04" + vk.to_string()
-    keccak = hashlib.sha3_256(pub).digest()
-    return "0x" + keccak[-20:].hex()
+    """Ethereum address: last 20 bytes of Keccak-256 over the 64-byte public key."""
+    if keccak is None:
+        raise RuntimeError("pycryptodome is required to derive WALLET_ADDRESS")
+    pk = bytes.fromhex(private_key.removeprefix("0x"))
+    if CCPublicKey is not None:
+        pub = CCPublicKey.from_secret(pk).format(compressed=False)[1:]   # drop 0x04 prefix
+    else:
+        pub = SigningKey.from_string(pk, curve=SECP256k1).verifying_key.to_string()
+    return "0x" + keccak.new(digest_bits=256, data=pub).digest()[-20:].hex()
 
 if PRIVATE_KEY and not WALLET_ADDRESS:
-    WALLET_ADDRESS = derive_address(PRIVATE_KEY)
+    try:
+        WALLET_ADDRESS = derive_address(PRIVATE_KEY)
+    except RuntimeError as e:
+        log("⚠️  %s — set WALLET_ADDRESS explicitly.", e)
+
+
+# A URL form, or a bare 11-char id.  The two can't both match (an 11-char
+# string is too short to hold a URL prefix plus an id), so one scan suffices.
+_VIDEO_ID_RE = re.compile(
+    r"(?:v=|\/embed\/|\/shorts\/|\/watch\?v=|youtu\.be\/)([0-9A-Za-z_-]{11})"
+    r"|^([0-9A-Za-z_-]{11})$"
+)
 
 
 def extract_video_id(user_input: str) -> str | None:
-    patterns = [
-        r"(?:v=|\/embed\/|\/shorts\/|\/watch\?v=|youtu\.be\/)([0-9A-Za-z_-]{11})",
-        r"^([0-9A-Za-z_-]{11})$",
-    ]
-    for p in patterns:
-        m = re.search(p, user_input)
-        if m:
-            return m.group(1)
-    return None
+    m = _VIDEO_ID_RE.search(user_input)
+    return (m.group(1) or m.group(2)) if m else None
 
 
-def extract_transcript_text(data) -> str:
+def track_transcript_text(data) -> str | None:
+    """
+    youtube-transcript.io answers [{"id", "title", "microformat", "tracks":
+    [{"language", "transcript": [{"text", "start", "dur"}, …]}, …]}].  Text
+    of the first track's segments, "" when that shape has no tracks or
+    segments yet (captions not out), None when the shape is unknown.
+    """
+    first = data[0] if type(data) is list and data else None
+    if type(first) is not dict or "tracks" not in first:
+        return None
+    tracks   = first["tracks"]
+    track    = tracks[0] if type(tracks) is list and tracks else None
+    segments = track.get("transcript") if type(track) is dict else None
+    if not segments:
+        return ""
+    try:
+        return " ".join(seg["text"] for seg in segments)
+    except (KeyError, TypeError):
+        return walk_transcript_text(segments)
+
+
+def extract_transcript_text(data) -> tuple[str, bool]:
+    """
+    (text, from_tracks).  Known youtube-transcript.io shape → the first
+    track's text only; any other shape gets the generic walk.  (The walk
+    also picks up title/description strings, which aren't spoken words, so
+    it is never used when the known shape simply has no captions yet.)
+    """
+    text = track_transcript_text(data)
+    if text is None:
+        return walk_transcript_text(data), False
+    return text, True
+
+
+def walk_transcript_text(data) -> str:
+    """
+    Depth-first walk of arbitrary transcript JSON collecting strings, with
+    {"text": "..."} segments taken whole.  Iterative (children pushed in
+    reverse to keep document order) so long transcripts cost no Python
+    frames and can't hit the recursion limit.
+    """
     parts = []
-    def collect(obj):
-        if isinstance(obj, str):
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        t   = type(obj)
+        if t is str:
             parts.append(obj)
-        elif isinstance(obj, dict):
-            if "text" in obj and isinstance(obj["text"], str):
-                parts.append(obj["text"])
+        elif t is dict:
+            text = obj.get("text")
+            if type(text) is str:
+                parts.append(text)
             else:
-                for v in obj.values():
-                    collect(v)
-        elif isinstance(obj, list):
-            for item in obj:
-                collect(item)
-    collect(data)
+                stack.extend(reversed(obj.values()))
+        elif t is list:
+            # Segment lists are flat runs of {"text": ...} dicts: take those
+            # inline and only fall back to the stack at the first item that
+            # needs descending into.
+            for i, item in enumerate(obj):
+                ti = type(item)
+                if ti is dict:
+                    text = item.get("text")
+                    if type(text) is str:
+                        parts.append(text)
+                        continue
+                elif ti is str:
+                    parts.append(item)
+                    continue
+                elif ti is not list:
+                    continue
+                stack.extend(reversed(obj[i:]))
+                break
     return " ".join(parts)
 
 
+_BARE_VIDEO_ID_RE = re.compile(r"[0-9A-Za-z_-]{11}")
+
+
+def _transcript_cache_path(video_id: str) -> str | None:
+    if TRANSCRIPT_CACHE_TTL <= 0 or not _BARE_VIDEO_ID_RE.fullmatch(video_id):
+        return None
+    return os.path.join(TRANSCRIPT_CACHE_DIR, f"{video_id}.txt")
+
+
+def _read_cached_transcript(video_id: str) -> str | None:
+    path = _transcript_cache_path(video_id)
+    if not path:
+        return None
+    try:
+        if time.time() - os.path.getmtime(path) < TRANSCRIPT_CACHE_TTL:
+            with open(path, encoding="utf-8") as f:
+                return f.read()
+        os.remove(path)                          # expired
+    except OSError:
+        pass
+    return None
+
+
+def _prune_transcript_cache():
+    """Drop expired entries (and stray temp files) so the directory stays bounded."""
+    cutoff = time.time() - TRANSCRIPT_CACHE_TTL
+    try:
+        with os.scandir(TRANSCRIPT_CACHE_DIR) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+
+def _write_cached_transcript(video_id: str, text: str):
+    path = _transcript_cache_path(video_id)
+    if not path:
+        return
+    try:
+        os.makedirs(TRANSCRIPT_CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)                    # readers never see a partial file
+    except OSError as e:
+        logger.debug("Transcript cache write failed: %s", e)
+        return
+    _prune_transcript_cache()                    # writes are one per new video, so this is rare
+
+
 def fetch_transcript(video_id: str) -> str | None:
+    """
+    Transcripts read from real caption tracks are kept on disk for
+    TRANSCRIPT_CACHE_TTL seconds, so re-checking a video (or a restart)
+    doesn't spend another API call.  Text from the generic walk is never
+    cached: it may be metadata returned before captions exist.
+    """
+    cached = _read_cached_transcript(video_id)
+    if cached is not None:
+        return cached
     if not API_TOKEN:
         return None
     try:
         url     = "https://www.youtube-transcript.io/api/transcripts"
         headers = {"Authorization": f"Basic {API_TOKEN}", "Content-Type": "application/json"}
-        r       = requests.post(url, headers=headers, json={"ids": [video_id]}, timeout=60)
+        r       = SESSION.post(url, headers=headers, json={"ids": [video_id]}, timeout=60)
         r.raise_for_status()
-        text = extract_transcript_text(r.json())
-        return text if text.strip() else None
+        text, from_tracks = extract_transcript_text(json_loads(r.content))
+        if not text.strip():
+            return None
+        if from_tracks:
+            _write_cached_transcript(video_id, text)
+        return text
     except Exception as e:
-        print(f"❌ Transcript fetch error: {e}")
+        logger.warning("❌ Transcript fetch error: %s", e)
         return None
 
 
-def get_token_id_for_outcome(market, target_outcome: str) -> str | None:
-    target = target_outcome.lower()
+def _json_list(raw) -> list:
+    """Gamma sends these fields either as lists or as JSON-encoded strings."""
+    if type(raw) is list:
+        return raw
+    if isinstance(raw, (str, bytes)):
+        try:    return json_loads(raw)
+        except: return []
+    return raw or []
+
+
+def get_token_ids(market, targets=("yes", "no")) -> dict[str, str | None]:
+    """
+    Token id per outcome in a single pass.  The tokens list is walked once,
+    and the outcomes / clobTokenIds JSON strings are only parsed (once) if
+    some outcome is still unresolved.
+    """
+    found = dict.fromkeys(targets)
     for token in market.get("tokens", []):
-        if token.get("outcome", "").lower() == target:
+        outcome = token.get("outcome", "").lower()
+        if outcome in found and found[outcome] is None:
             tid = token.get("token_id")
             if tid is not None:
-                return str(tid)
-    outcomes_raw = market.get("outcomes", [])
-    if isinstance(outcomes_raw, str):
-        try:    outcomes = json.loads(outcomes_raw)
-        except: outcomes = []
-    else:
-        outcomes = outcomes_raw or []
-    clob_ids_raw = market.get("clobTokenIds", []) or market.get("clob_token_ids", [])
-    if isinstance(clob_ids_raw, str):
-        try:    clob_ids = json.loads(clob_ids_raw)
-        except: clob_ids = []
-    else:
-        clob_ids = clob_ids_raw or []
+                found[outcome] = str(tid)
+    if None not in found.values():
+        return found
+
+    outcomes = _json_list(market.get("outcomes", []))
+    clob_ids = _json_list(market.get("clobTokenIds", []) or market.get("clob_token_ids", []))
     for idx, outcome in enumerate(outcomes):
-        if str(outcome).lower() == target and idx < len(clob_ids):
-            return str(clob_ids[idx])
-    return None
+        outcome = str(outcome).lower()
+        if outcome in found and found[outcome] is None and idx < len(clob_ids):
+            found[outcome] = str(clob_ids[idx])
+    return found
 
 
 # ─────────────────────────────────────────────
@@ -281,22 +500,22 @@ def _yt_get(url: str, params: dict, chat_id: int | None = None) -> "requests.Res
             return None
         request_params = {**base_params, "key": key}
         try:
-            r = requests.get(url, params=request_params, timeout=15)
+            r = SESSION.get(url, params=request_params, timeout=15)
             if r.status_code == 403:
-                log(f"[YT] ⚠️  403 quota hit. Rotating key…")
+                log("[YT] ⚠️  403 quota hit. Rotating key…")
                 YT_KEYS.mark_exhausted(key, chat_id=chat_id)
                 tried += 1
                 continue
             if r.status_code == 400:
-                log(f"[YT] ❌ 400 Bad Request — {r.text[:300]}")
+                log("[YT] ❌ 400 Bad Request — %s", r.text[:300])
                 return None
             r.raise_for_status()
             return r
         except requests.exceptions.HTTPError as e:
-            log(f"[YT] ❌ HTTP error: {e}")
+            log("[YT] ❌ HTTP error: %s", e)
             tried += 1
         except Exception as e:
-            log(f"[YT] ❌ Request exception: {e}")
+            log("[YT] ❌ Request exception: %s", e)
             return None
     return None
 
@@ -306,11 +525,14 @@ def _uploads_playlist_id(channel_id: str) -> str:
     return "UU" + channel_id[2:]
 
 
+_ISO8601_DURATION_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
+
+
 def parse_iso8601_duration(duration: str) -> int:
     """Convert ISO 8601 duration string to total seconds. Returns -1 for PT0S (unpopulated)."""
     if not duration or duration in ("PT0S", "P0D", ""):
         return -1   # -1 means "unknown / not yet populated"
-    m = re.match(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?", duration)
+    m = _ISO8601_DURATION_RE.match(duration)
     if not m:
         return -1
     h, mi, s = (int(x or 0) for x in m.groups())
@@ -326,7 +548,7 @@ def get_video_count(channel_id: str, chat_id: int | None = None) -> int | None:
     if not YT_KEYS.available:
         return None
     try:
-        log(f"[YT] channels.statistics → {channel_id}")
+        log("[YT] channels.statistics → %s", channel_id)
         r = _yt_get(
             "https://www.googleapis.com/youtube/v3/channels",
             {"id": channel_id, "part": "statistics"},
@@ -334,15 +556,14 @@ def get_video_count(channel_id: str, chat_id: int | None = None) -> int | None:
         )
         if r is None:
             return None
-        items = r.json().get("items", [])
+        items = json_loads(r.content).get("items", [])
         if not items:
             return None
         count = int(items[0]["statistics"]["videoCount"])
-        log(f"[YT] videoCount = {count}")
+        log("[YT] videoCount = %s", count)
         return count
     except Exception as e:
-        import traceback
-        log(f"[YT] ❌ get_video_count error: {e}\n{traceback.format_exc()}")
+        log("[YT] ❌ get_video_count error: %s\n%s", e, traceback.format_exc())
         return None
 
 
@@ -367,7 +588,7 @@ def get_latest_video(channel_id: str, chat_id: int | None = None,
 
     def _fetch_candidates():
         playlist_id = _uploads_playlist_id(channel_id)
-        log(f"[YT] playlistItems.list → {playlist_id}")
+        log("[YT] playlistItems.list → %s", playlist_id)
         r = _yt_get(
             "https://www.googleapis.com/youtube/v3/playlistItems",
             {"playlistId": playlist_id, "part": "snippet", "maxResults": 8},
@@ -375,8 +596,8 @@ def get_latest_video(channel_id: str, chat_id: int | None = None,
         )
         if r is None:
             return []
-        items = r.json().get("items", [])
-        log(f"[YT] playlistItems OK — {len(items)} items")
+        items = json_loads(r.content).get("items", [])
+        log("[YT] playlistItems OK — %d items", len(items))
         candidates = []
         for item in items:
             snippet = item.get("snippet", {})
@@ -385,7 +606,7 @@ def get_latest_video(channel_id: str, chat_id: int | None = None,
             title   = snippet.get("title", "")
             if vid_id:
                 candidates.append((vid_id, title))
-                log(f"[YT]   candidate: {vid_id} | {title}")
+                log("[YT]   candidate: %s | %s", vid_id, title)
         return candidates
 
     def _fetch_durations(candidates):
@@ -399,12 +620,12 @@ def get_latest_video(channel_id: str, chat_id: int | None = None,
         )
         durations: dict[str, int] = {}
         if r2:
-            for v_item in r2.json().get("items", []):
+            for v_item in json_loads(r2.content).get("items", []):
                 vid  = v_item["id"]
                 dur  = v_item["contentDetails"]["duration"]
                 secs = parse_iso8601_duration(dur)
                 durations[vid] = secs
-                log(f"[YT]   duration: {vid} → {dur} ({secs}s)")
+                log("[YT]   duration: %s → %s (%ss)", vid, dur, secs)
         else:
             log("[YT] ⚠️  videos.list failed — will treat all as non-Shorts")
         return durations
@@ -421,7 +642,7 @@ def get_latest_video(channel_id: str, chat_id: int | None = None,
                         if not is_jre_mma_episode(title)]
             skipped = len(candidates) - len(filtered)
             if skipped:
-                log(f"[YT] ⏭  Skipped {skipped} JRE MMA Show episode(s).")
+                log("[YT] ⏭  Skipped %d JRE MMA Show episode(s).", skipped)
             candidates = filtered
             if not candidates:
                 log("[YT] All candidates were JRE MMA Show episodes — nothing to process.")
@@ -432,8 +653,8 @@ def get_latest_video(channel_id: str, chat_id: int | None = None,
         # ── Check if any duration came back as -1 (PT0S / unpopulated) ──
         unpopulated = [vid for vid, _ in candidates if durations.get(vid, -1) == -1]
         if unpopulated:
-            log(f"[YT] ⚠️  {len(unpopulated)} video(s) have PT0S duration (metadata not ready). "
-                f"Waiting 20s then retrying…")
+            log("[YT] ⚠️  %d video(s) have PT0S duration (metadata not ready). "
+                "Waiting 20s then retrying…", len(unpopulated))
             time.sleep(20)
             durations = _fetch_durations(candidates)   # retry once
 
@@ -443,21 +664,20 @@ def get_latest_video(channel_id: str, chat_id: int | None = None,
 
             if secs == -1:
                 # Still unpopulated after retry → ASSUME NOT A SHORT.
-                log(f"[YT]   {vid_id}: duration still unknown → treating as NON-Short ✅")
+                log("[YT]   %s: duration still unknown → treating as NON-Short ✅", vid_id)
                 return {"video_id": vid_id, "title": title}
 
             is_sh = secs <= 60
-            log(f"[YT]   {vid_id}: {secs}s → {'SHORT ❌' if is_sh else 'VIDEO ✅'}")
+            log("[YT]   %s: %ss → %s", vid_id, secs, "SHORT ❌" if is_sh else "VIDEO ✅")
             if not is_sh:
-                log(f"[YT] ✅ Selected: {vid_id} | {title}")
+                log("[YT] ✅ Selected: %s | %s", vid_id, title)
                 return {"video_id": vid_id, "title": title}
 
-        log(f"[YT] All {len(candidates)} candidates are confirmed Shorts (duration ≤ 60s).")
+        log("[YT] All %d candidates are confirmed Shorts (duration ≤ 60s).", len(candidates))
         return None
 
     except Exception as e:
-        import traceback
-        log(f"[YT] ❌ get_latest_video error: {e}\n{traceback.format_exc()}")
+        log("[YT] ❌ get_latest_video error: %s\n%s", e, traceback.format_exc())
         return None
 
 
@@ -465,19 +685,258 @@ def get_latest_video(channel_id: str, chat_id: int | None = None,
 # COUNTING ENGINE
 # ─────────────────────────────────────────────
 
-def count_matches(text_lower: str, category_spec: tuple) -> int:
+_REGEX_META = set(".^$*+?{}[]()|")
+
+def split_alternatives(pattern: str) -> list[str]:
+    """Top-level `|` alternatives of `pattern`; groups and classes stay intact."""
+    alternatives, depth, in_class, start, i = [], 0, False, 0, 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = c != "]"
+        elif c == "[":
+            in_class = True
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "|" and depth == 0:
+            alternatives.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    alternatives.append(pattern[start:])
+    return alternatives
+
+
+def _group_end(pattern: str, i: int) -> int:
+    """Index of the ')' closing the group opened at pattern[i], or -1."""
+    depth, in_class = 0, False
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = c != "]"
+        elif c == "[":
+            in_class = True
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return -1
+
+
+def _alternative_prefixes(alt: str) -> list[str] | None:
+    """
+    Literal strings, one of which every match of the single alternative `alt`
+    starts with.  A leading mandatory group such as (thousand|million) is
+    expanded into one prefix per branch.  None if there is no literal prefix.
+    """
+    while alt.startswith("\\b"):
+        alt = alt[2:]
+    lit, i = [], 0
+    while i < len(alt):
+        c = alt[i]
+        if c == "(":
+            end  = _group_end(alt, i)
+            body = alt[i + 1:end]
+            if body.startswith("?:"):
+                body = body[2:]
+            elif end < 0 or body.startswith("?"):
+                break                           # lookaround / inline flags
+            if end + 1 < len(alt) and alt[end + 1] in "?*{":
+                break                           # optional group
+            branches = [_alternative_prefixes(b) for b in split_alternatives(body)]
+            if None in branches:
+                break
+            head = "".join(lit)
+            return [head + p for prefixes in branches for p in prefixes]
+        if c == "\\":
+            if i + 1 >= len(alt) or alt[i + 1].isalnum():
+                break                           # \b, \s, \d, \w … are not literals
+            lit.append(alt[i + 1])
+            i += 2
+        elif c in _REGEX_META:
+            break
+        else:
+            lit.append(c)
+            i += 1
+        if i < len(alt) and alt[i] in "?*{":
+            lit.pop()                           # last char is optional
+            break
+        if i < len(alt) and alt[i] == "+":
+            break
+    return ["".join(lit)] if lit else None
+
+
+@functools.lru_cache(maxsize=None)
+def leading_literals(pattern: str) -> tuple[str, ...] | None:
+    """
+    Lower-cased literal prefixes covering every top-level alternative in
+    `pattern`.  Any match must start with one of them, so a text containing
+    none of them can be skipped without running the regex.  Returns None
+    when some alternative has no literal prefix (e.g. starts with \\w*).
+    """
+    literals = []
+    for alt in split_alternatives(pattern):
+        prefixes = _alternative_prefixes(alt)
+        if prefixes is None:
+            return None
+        literals.extend(p.lower() for p in prefixes)
+    # "american" is implied by "america" — keep only the shortest prefixes
+    return tuple(sorted({lit for lit in literals
+                         if not any(o != lit and lit.startswith(o) for o in literals)}))
+
+
+def literal_prefilter_ok(text_lower: str) -> bool:
+    """
+    re.IGNORECASE lets 'ı' and 'ſ' match 'i' and 's', so a plain substring
+    test would miss them — only use literal prefilters when they are absent.
+    Lower-cased text without them also matches a lower-case pattern the same
+    with or without IGNORECASE, so the same flag enables folded_variant().
+    """
+    return text_lower.isascii() or ("ı" not in text_lower and "ſ" not in text_lower)
+
+
+def _absent(text_lower: str, pattern: str) -> bool:
+    literals = leading_literals(pattern)
+    return literals is not None and not any(lit in text_lower for lit in literals)
+
+
+@functools.lru_cache(maxsize=None)
+def folded_variant(pattern: re.Pattern) -> re.Pattern:
+    """
+    Case-sensitive twin of an IGNORECASE pattern, for already-folded text
+    (see literal_prefilter_ok).  The engine then skips per-character case
+    folding, roughly 3x faster.  Patterns with upper-case literals keep
+    IGNORECASE.
+    """
+    if any(ch.isupper() for ch in re.sub(r"\\.", "", pattern.pattern)):
+        return pattern
+    return re.compile(pattern.pattern, pattern.flags & ~re.IGNORECASE)
+
+
+def compile_spec(category_spec: tuple) -> tuple:
+    """("simple", pat) / ("fullname", full, fallback) with patterns compiled once."""
+    kind, *patterns = category_spec
+    return (kind, *(re.compile(p, re.IGNORECASE) for p in patterns))
+
+
+def count_matches(text_lower: str, category_spec: tuple, prefilter: bool = False) -> int:
+    """
+    `category_spec` is a compiled spec (see compile_spec).
+    prefilter=True skips the regex when none of the pattern's literal
+    prefixes occur in the text (str `in` runs in C, far cheaper than a scan).
+    """
     if category_spec[0] == "simple":
         _, pattern = category_spec
-        return len(re.findall(pattern, text_lower, re.IGNORECASE))
+        if prefilter:
+            if _absent(text_lower, pattern.pattern):
+                return 0
+            pattern = folded_variant(pattern)
+        return len(pattern.findall(text_lower))
     elif category_spec[0] == "fullname":
         _, full_pat, fallback_pat = category_spec
-        full_matches = re.findall(full_pat, text_lower, re.IGNORECASE)
-        scrubbed = re.sub(full_pat, "XXFULLNAMEXX", text_lower, flags=re.IGNORECASE)
-        leftover = re.findall(fallback_pat, scrubbed, re.IGNORECASE)
-        return len(full_matches) + len(leftover)
+        if prefilter:
+            if _absent(text_lower, full_pat.pattern) and _absent(text_lower, fallback_pat.pattern):
+                return 0
+            full_pat, fallback_pat = folded_variant(full_pat), folded_variant(fallback_pat)
+        # subn scrubs and counts the full-name hits in the same pass
+        scrubbed, n_full = full_pat.subn("XXFULLNAMEXX", text_lower)
+        leftover = fallback_pat.findall(scrubbed)
+        return n_full + len(leftover)
     return 0
 
 
+@functools.lru_cache(maxsize=None)
+def fused_scanner(simple_specs: tuple, folded: bool = False) -> re.Pattern:
+    """
+    One regex for a tuple of (category, compiled "simple" pattern), so the
+    transcript is walked once instead of once per category.  Always built
+    from a market's full simple set (see simple_specs_of), so there is one
+    scanner per market and variant however the prefilter prunes categories.
+
+    The leading lookahead only stops where some category can start (the
+    shared \\b is factored out so mid-word positions fail fast).  Each
+    category then sits in its own optional lookahead group g<i>, so
+    overlapping categories ("$ thousand" → Dollar and Thousand/Million)
+    are all reported at the same position.  folded=True drops IGNORECASE
+    (see folded_variant) except around patterns that still need it.
+    """
+    def src(pattern, part):
+        if folded and folded_variant(pattern) is pattern:
+            return f"(?i:{part})"
+        return part
+
+    boundary, other = [], []
+    for _, pattern in simple_specs:
+        for alt in split_alternatives(pattern.pattern):
+            if alt.startswith("\\b"):
+                boundary.append(src(pattern, alt[2:]))
+            else:
+                other.append(src(pattern, alt))
+    gate   = "|".join(([rf"\b(?:{'|'.join(boundary)})"] if boundary else []) + other)
+    groups = "".join(f"(?:(?=(?P<g{i}>{src(pattern, pattern.pattern)})))?"
+                     for i, (_, pattern) in enumerate(simple_specs))
+    return re.compile(f"(?=(?:{gate})){groups}", 0 if folded else re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def simple_specs_of(compiled_groups: tuple) -> tuple:
+    """The (category, compiled pattern) pairs of a market's "simple" specs."""
+    return tuple((cat, spec[1]) for cat, spec in compiled_groups if spec[0] == "simple")
+
+
+def count_simple_fused(text_lower: str, simple_specs: tuple, folded: bool = False,
+                       skip: frozenset = frozenset()) -> dict[str, int]:
+    """
+    Same result as len(pattern.findall(text_lower)) per category, in a single
+    pass: a hit only counts if it starts at or after the end of that
+    category's previous hit, mirroring findall's non-overlapping scan.
+    Categories in `skip` (known absent) are reported as 0 without being
+    checked at each hit.
+    """
+    scanner = fused_scanner(simple_specs, folded)
+    active  = [(i, scanner.groupindex[f"g{i}"])
+               for i, (cat, _) in enumerate(simple_specs) if cat not in skip]
+    counts  = [0] * len(simple_specs)
+    resume  = [0] * len(simple_specs)
+    if active:
+        for m in scanner.finditer(text_lower):
+            pos = m.start()
+            for i, group in active:
+                end = m.end(group)
+                if end != -1 and pos >= resume[i]:
+                    counts[i] += 1
+                    resume[i] = end
+    return {cat: n for (cat, _), n in zip(simple_specs, counts)}
+
+
+def count_categories(text_lower: str, compiled_groups: tuple, prefilter: bool = False) -> dict[str, int]:
+    """
+    Counts for every category in `compiled_groups` ((category, compiled spec)
+    pairs).  "simple" categories share one fused scan; "fullname" ones need
+    their own substitute-then-count pass.
+    """
+    counts, skip = {}, set()
+    for cat, spec in compiled_groups:
+        if spec[0] != "simple":
+            counts[cat] = count_matches(text_lower, spec, prefilter)
+        elif prefilter and _absent(text_lower, spec[1].pattern):
+            skip.add(cat)
+    simple = simple_specs_of(compiled_groups)
+    if simple:
+        counts.update(count_simple_fused(text_lower, simple, prefilter, frozenset(skip)))
+    return counts
+
+
 # ─────────────────────────────────────────────
 # MARKET CONFIGS
 # ─────────────────────────────────────────────
@@ -670,69 +1129,111 @@ MARKET_CONFIGS = {
     },
 }
 
+# Per-market display rows, fixed at import: (category, padded label, threshold)
+# in sorted order, so render_results doesn't re-sort or re-resolve thresholds.
+CATEGORY_ROWS = {
+    mk: tuple(
+        (cat, f"{cat:<28}", cfg.get("thresholds", {}).get(cat, cfg.get("default_threshold", 1)))
+        for cat in sorted(cfg["word_groups"])
+    )
+    for mk, cfg in MARKET_CONFIGS.items()
+}
+
+# Word-group regexes compiled once at import: {market: ((category, compiled spec), …)}
+COMPILED_GROUPS = {
+    mk: tuple((cat, compile_spec(spec)) for cat, spec in cfg["word_groups"].items())
+    for mk, cfg in MARKET_CONFIGS.items()
+}
+
 
 # ─────────────────────────────────────────────
 # MARKET MATCHING FUNCTIONS
+# Questions for a slug don't change between
+# fetches, so results are memoized per question.
 # ─────────────────────────────────────────────
 
+def keyword_scanner(rules):
+    """
+    Turn a priority ladder of (category, (any-of set, any-of set, …)) rules
+    into a matcher that scans the text once.  A zero-width lookahead finds
+    the longest keyword at every position; keywords that are prefixes of it
+    ("mr" in "mrbeast") are implied, so overlapping hits are not lost.
+    """
+    words   = sorted({w for _, groups in rules for g in groups for w in g},
+                     key=len, reverse=True)
+    pat     = re.compile("(?=(" + "|".join(map(re.escape, words)) + "))")
+    implied = {w: frozenset(o for o in words if w.startswith(o)) for w in words}
+
+    def match(text: str) -> str | None:
+        found = set()
+        for w in set(pat.findall(text)):
+            found |= implied[w]
+        for cat, groups in rules:
+            if all(not found.isdisjoint(g) for g in groups):
+                return cat
+        return None
+    return match
+
+
+_MRBEAST_SAY_RE = re.compile(r"\bsay\s+(.+?)(?:\s+\d+\+\s+times?|\s+during\b)")
+
+# First matching rule wins, same order as the original if-ladder.
+_match_mrbeast_term = keyword_scanner((
+    ("Beast Games",             ({"beast games"},)),
+    ("Mystery Box",             ({"mystery box"},)),
+    ("World's Biggest/Largest", ({"world"}, {"biggest", "largest"})),
+    ("Tesla/Lamborghini",       ({"tesla", "lamborghini"},)),
+    ("Helicopter/Jet",          ({"helicopter", "jet"},)),
+    ("Thousand/Million",        ({"thousand", "million", "billion"},)),
+    ("Dollar",                  ({"dollar"},)),
+    ("Subscribe",               ({"subscribe"},)),
+    ("Insane",                  ({"insane"},)),
+    ("Feastables",              ({"feastables"},)),
+    ("Cocoa",                   ({"cocoa"},)),
+    ("Chocolate",               ({"chocolate"},)),
+    ("MrBeast",                 ({"mr"}, {"beast"})),      # also covers "mrbeast"
+    ("Eliminated",              ({"eliminated"},)),
+    ("Challenge",               ({"challenge"},)),
+    ("Massive",                 ({"massive"},)),
+    ("Island",                  ({"island"},)),
+    ("Trap",                    ({"trap"},)),
+    ("Car/Supercar",            ({"car"},)),
+))
+
+_match_joerogan_question = keyword_scanner((
+    ("Good",                 ({"good"}, {"20"})),
+    ("America/American",     ({"america"}, {"10"})),       # "american" implies "america"
+    ("Dude",                 ({"dude"}, {"10"})),
+    ("President/Admin",      ({"president", "administration"}, {"3"})),
+    ("Peace/War",            ({"peace", "war"}, {"3"})),
+    ("Prime Minister",       ({"prime minister"},)),
+    ("Black and White",      ({"black and white"},)),
+    ("Addiction/Drug",       ({"addiction", "drug"},)),
+    ("Criminal/Criminalize", ({"criminal"},)),
+    ("Amen",                 ({"amen"},)),
+    ("Kiss",                 ({"kiss"},)),
+    ("UFO/Alien",            ({"ufo", "alien"},)),
+    ("Truth",                ({"truth"},)),
+    ("Donald/Trump",         ({"donald", "trump"},)),
+    ("Bernie/Sanders",       ({"bernie", "sanders"},)),
+    ("Hillary/Clinton",      ({"hillary", "clinton"},)),
+    ("AOC",                  ({"aoc"},)),
+    ("Obama",                ({"obama"},)),
+    ("Peace/War",            ({"peace", "war"},)),
+))
+
+
+@functools.lru_cache(maxsize=1024)
 def match_market_mrbeast(q: str) -> str | None:
     ql = q.lower()
-    m = re.search(r"\bsay\s+(.+?)(?:\s+\d+\+\s+times?|\s+during\b)", ql)
+    m = _MRBEAST_SAY_RE.search(ql)
     term = m.group(1).strip() if m else ql
-
-    if "beast games"                      in term: return "Beast Games"
-    if "mystery box"                      in term: return "Mystery Box"
-    if "world" in term and ("biggest" in term or "largest" in term):
-                                                   return "World's Biggest/Largest"
-    if "tesla"        in term:                     return "Tesla/Lamborghini"
-    if "lamborghini"  in term:                     return "Tesla/Lamborghini"
-    if "helicopter"   in term:                     return "Helicopter/Jet"
-    if "jet"          in term:                     return "Helicopter/Jet"
-    if "thousand"     in term or "million" in term or "billion" in term:
-                                                   return "Thousand/Million"
-    if "dollar"       in term:                     return "Dollar"
-    if "subscribe"    in term:                     return "Subscribe"
-    if "insane"       in term:                     return "Insane"
-    if "feastables"   in term:                     return "Feastables"
-    if "cocoa"        in term:                     return "Cocoa"
-    if "chocolate"    in term:                     return "Chocolate"
-    if "mr" in term and "beast" in term:           return "MrBeast"
-    if "mrbeast"      in term:                     return "MrBeast"
-    if "eliminated"   in term:                     return "Eliminated"
-    if "challenge"    in term:                     return "Challenge"
-    if "massive"      in term:                     return "Massive"
-    if "island"       in term:                     return "Island"
-    if "trap"         in term:                     return "Trap"
-    if "car"          in term:                     return "Car/Supercar"
-    return None
+    return _match_mrbeast_term(term)
 
 
+@functools.lru_cache(maxsize=1024)
 def match_market_joerogan(q):
-    ql = q.lower()
-
-    if "good" in ql and "20" in ql:                                    return "Good"
-    if ("america" in ql or "american" in ql) and "10" in ql:           return "America/American"
-    if "dude" in ql and "10" in ql:                                    return "Dude"
-
-    if ("president" in ql or "administration" in ql) and "3" in ql:   return "President/Admin"
-    if ("peace" in ql or "war" in ql) and "3" in ql:                  return "Peace/War"
-
-    if "prime minister" in ql:                                         return "Prime Minister"
-    if "black and white" in ql:                                        return "Black and White"
-    if "addiction" in ql or "drug" in ql:                              return "Addiction/Drug"
-    if "criminal" in ql or "criminalize" in ql:                        return "Criminal/Criminalize"
-    if "amen" in ql:                                                   return "Amen"
-    if "kiss" in ql:                                                   return "Kiss"
-    if "ufo" in ql or "alien" in ql:                                   return "UFO/Alien"
-    if "truth" in ql:                                                  return "Truth"
-    if "donald" in ql or ("trump" in ql and "donald" not in ql):      return "Donald/Trump"
-    if "trump" in ql:                                                  return "Donald/Trump"
-    if "bernie" in ql or "sanders" in ql:                              return "Bernie/Sanders"
-    if "hillary" in ql or "clinton" in ql:                             return "Hillary/Clinton"
-    if "aoc" in ql:                                                    return "AOC"
-    if "obama" in ql:                                                  return "Obama"
-    if "peace" in ql or "war" in ql:                                   return "Peace/War"
-    return None
+    return _match_joerogan_question(q.lower())
 
 
 def match_market_mychannel(q):
@@ -750,19 +1251,169 @@ MARKET_MATCHERS = {
 }
 
 
+# ─────────────────────────────────────────────
+# POLYMARKET RATE LIMITING
+# Polymarket enforces limits per endpoint over
+# 10-second windows; a token bucket per endpoint
+# keeps us under them instead of eating 429s.
+# ─────────────────────────────────────────────
+
+class TokenBucket:
+    def __init__(self, rate: float, cap: float):
+        self.rate        = rate          # tokens refilled per second
+        self.cap         = cap
+        self.tokens      = cap
+        self.last_refill = time.monotonic()
+        self._lock       = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.cap, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+POLY_BUCKETS = {
+    "/book":   TokenBucket(rate=1500 / 10, cap=1500),   # CLOB order book
+    "/order":  TokenBucket(rate=5000 / 10, cap=5000),   # CLOB order placement (burst)
+    "/events": TokenBucket(rate=10,        cap=10),     # Gamma event lookups
+    "/midpoints": TokenBucket(rate=500 / 10, cap=500),  # CLOB batch midpoints
+}
+POLY_MAX_429_RETRIES = 3
+
+
+def poly_acquire(url_path: str):
+    for prefix, bucket in POLY_BUCKETS.items():
+        if url_path.startswith(prefix):
+            bucket.acquire()
+            return
+
+
+def _retry_after_secs(resp: "requests.Response") -> float:
+    try:
+        return max(float(resp.headers.get("Retry-After", 1)), 0.0)
+    except ValueError:
+        return 1.0
+
+
+def _poly_request(method: str, url: str, timeout: int = 15, **kwargs) -> "requests.Response":
+    """Request against a Polymarket API, rate-limited and honouring Retry-After on 429."""
+    path = "/" + url.split("://", 1)[-1].split("/", 1)[-1]
+    for attempt in range(POLY_MAX_429_RETRIES + 1):
+        poly_acquire(path)
+        resp = SESSION.request(method, url, timeout=timeout, **kwargs)
+        if resp.status_code != 429 or attempt == POLY_MAX_429_RETRIES:
+            return resp
+        wait = _retry_after_secs(resp)
+        log("[Poly] ⚠️  429 on %s — retrying in %.1fs", path, wait)
+        time.sleep(wait)
+    return resp
+
+
+def _poly_get(url: str, timeout: int = 15, **kwargs) -> "requests.Response":
+    return _poly_request("GET", url, timeout, **kwargs)
+
+
 # ─────────────────────────────────────────────
 # POLYMARKET DATA FETCH
 # ─────────────────────────────────────────────
 
+_poly_cache: dict[str, tuple[float, tuple, float]] = {}   # slug → (expires_at, (prices, token_ids), meta_expires_at)
+_poly_inflight: dict[str, Future] = {}             # slug → fetch currently running
+_poly_etags: dict[str, tuple[str, tuple]] = {}     # slug → (ETag, data parsed from that body); under _poly_cache_lock
+_poly_cache_lock = threading.Lock()
+
+
 def get_polymarket_data(slug, match_fn, word_groups):
+    """
+    Cached per slug for POLY_TTL seconds (POLY_NEG_TTL for failures), so a
+    burst of transcripts shares one Gamma fetch + parse.  Callers arriving
+    while a fetch for the same slug is in flight wait on it instead of
+    issuing their own.  Within POLY_META_TTL of the last full fetch, expired
+    prices are refreshed from CLOB midpoints for the cached token ids.
+    """
     if not slug:
         return None, None
+    now = time.monotonic()
+    with _poly_cache_lock:
+        hit = _poly_cache.get(slug)
+        if hit and now < hit[0]:
+            return hit[1]
+        inflight = _poly_inflight.get(slug)
+        if inflight is None:
+            fut = _poly_inflight[slug] = Future()
+    if inflight is not None:
+        return inflight.result()
+
+    try:
+        data = None
+        if hit and hit[1][0] is not None and now < hit[2]:
+            data, meta_expires = _refresh_prices(hit[1]), hit[2]
+        if data is None:
+            data = _fetch_polymarket_data(slug, match_fn, word_groups)
+            meta_expires = time.monotonic() + POLY_META_TTL if data[0] is not None else 0.0
+    except BaseException as e:
+        with _poly_cache_lock:
+            _poly_inflight.pop(slug, None)
+        fut.set_exception(e)
+        raise
+    ttl = POLY_TTL if data[0] is not None else POLY_NEG_TTL
+    with _poly_cache_lock:
+        _poly_cache[slug] = (time.monotonic() + ttl, data, meta_expires)
+        _poly_inflight.pop(slug, None)
+    fut.set_result(data)
+    return data
+
+
+def _refresh_prices(data: tuple) -> tuple | None:
+    """
+    Re-price cached markets from one CLOB /midpoints call instead of the
+    full Gamma event.  None (→ full refetch) if any priced category lacks a
+    YES token id or the call fails.
+    """
+    prices, token_ids = data
+    yes_tokens = {cat: token_ids.get(cat, {}).get("yes") for cat in prices}
+    if not yes_tokens or None in yes_tokens.values():
+        return None
+    try:
+        resp = _poly_request("POST", "https://clob.polymarket.com/midpoints",
+                             json=[{"token_id": tok} for tok in yes_tokens.values()])
+        resp.raise_for_status()
+        mids = json_loads(resp.content)
+        return {cat: float(mids[tok]) for cat, tok in yes_tokens.items()}, token_ids
+    except Exception as e:
+        logger.debug("[Poly] midpoint refresh failed, refetching event: %s", e)
+        return None
+
+
+def prefetch_polymarket(market_key: str):
+    """Warm the cache in the background so the next transcript finds it fresh."""
+    config = MARKET_CONFIGS[market_key]
+    if config.get("testing", False) or not config["slug"]:
+        return
+    EXECUTOR.submit(get_polymarket_data, config["slug"],
+                    MARKET_MATCHERS[config["match_market"]], config["word_groups"])
+
+
+def _fetch_polymarket_data(slug, match_fn, word_groups):
     try:
         url  = f"https://gamma-api.polymarket.com/events/slug/{slug}"
-        print(f"\n🔍 Fetching: {url}")
-        resp = requests.get(url, timeout=15)
+        logger.debug("🔍 Fetching: %s", url)
+        with _poly_cache_lock:
+            cached = _poly_etags.get(slug)
+        resp = _poly_get(url, timeout=15,
+                         headers={"If-None-Match": cached[0]} if cached else None)
+        if resp.status_code == 304 and cached:
+            return cached[1]
         resp.raise_for_status()
-        markets = resp.json().get("markets", [])
+        markets = json_loads(resp.content).get("markets", [])
         if not markets:
             return None, None
 
@@ -773,75 +1424,208 @@ def get_polymarket_data(slug, match_fn, word_groups):
             if not cat or cat in matched_cats:
                 continue
             matched_cats.add(cat)
-            op = market.get("outcome_prices") or market.get("outcomePrices", [])
-            if isinstance(op, str):
-                try: op = json.loads(op)
-                except: op = []
+            op = _json_list(market.get("outcome_prices") or market.get("outcomePrices", []))
             if isinstance(op, list) and op:
                 prices[cat] = float(op[0])
-            yes_tok = get_token_id_for_outcome(market, "yes")
-            no_tok  = get_token_id_for_outcome(market, "no")
-            token_ids[cat] = {"yes": yes_tok, "no": no_tok}
+            token_ids[cat] = get_token_ids(market)
+        etag = resp.headers.get("ETag")
+        if etag:
+            with _poly_cache_lock:
+                _poly_etags[slug] = (etag, (prices, token_ids))
         return prices, token_ids
     except Exception as e:
-        print(f"❌ Polymarket error: {e}")
+        logger.warning("❌ Polymarket error: %s", e)
         return None, None
 
 
+# ─────────────────────────────────────────────
+# ORDER PLACEMENT
+# Single entry point for building, signing and
+# posting an order, so the signing backend can be
+# swapped without touching the trade loop.
+# ─────────────────────────────────────────────
+
+_clob_client = None
+_clob_lock   = threading.Lock()
+
+
+def get_clob_client():
+    """
+    Shared ClobClient — built and API creds derived on first use, then reused
+    so each transcript doesn't pay for a fresh client + EIP-712 creds signature.
+    """
+    global _clob_client
+    client = _clob_client
+    if client is not None:          # fast path: no lock once built
+        return client
+    with _clob_lock:
+        if _clob_client is None:
+            pk     = PRIVATE_KEY[2:] if PRIVATE_KEY.startswith("0x") else PRIVATE_KEY
+            client = ClobClient(
+                host="https://clob.polymarket.com",
+                chain_id=137,
+                key=pk,
+                signature_type=1,
+                funder=WALLET_ADDRESS or None,
+            )
+            client.set_api_creds(client.create_or_derive_api_creds())
+            _clob_client = client
+        return _clob_client
+
+
+def reset_clob_client(stale=None):
+    """
+    Drop the shared client so the next get_clob_client() re-derives creds.
+    With `stale`, only if that is still the shared one — concurrent orders
+    failing on the same old creds then trigger a single rebuild.
+    """
+    global _clob_client
+    with _clob_lock:
+        if stale is None or _clob_client is stale:
+            _clob_client = None
+
+
+def is_auth_error(ex: Exception) -> bool:
+    """401/403 from the CLOB API — the cached API creds are no longer valid."""
+    return getattr(ex, "status_code", None) in (401, 403)
+
+
+def _prewarm_clob_client():
+    try:
+        get_clob_client()
+        log("[CLOB] ✅ Client ready")
+    except Exception as e:
+        log("[CLOB] ⚠️  Prewarm failed, will retry on first trade: %s", e)
+
+
+# Orders go out TRADE_CONCURRENCY at a time; POLY_BUCKETS keeps the burst within limits
+TRADE_POOL = ThreadPoolExecutor(max_workers=TRADE_CONCURRENCY)
+
+
+def ist_clock() -> str:
+    import datetime
+    ist = datetime.datetime.utcnow() + datetime.timedelta(hours=5, minutes=30)
+    return ist.strftime("%H:%M:%S IST")
+
+
+def place_trade(cat: str, side: str, tok: str, amount: float) -> str:
+    """Place one order on the shared client and return its trade-log line."""
+    client = None
+    try:
+        client   = get_clob_client()
+        t_before = time.monotonic()
+        resp     = place_market_order(client, tok, amount)
+        elapsed  = time.monotonic() - t_before
+        trade_ts = ist_clock()
+        status   = resp.get("status", "")
+        if resp.get("order_id") or resp.get("success") or status in ("matched","live","open"):
+            return f"✅ {cat[:16]:<16} {side}  ${amount}  @{trade_ts}  ({elapsed:.2f}s)"
+        return f"⚠️ {cat[:16]:<16} {side}  No fill  @{trade_ts}  ({elapsed:.2f}s)"
+    except Exception as ex:
+        if is_auth_error(ex):
+            reset_clob_client(client)
+        return f"❌ {cat[:16]:<16} {side}  Error: {str(ex)[:40]}  @{ist_clock()}"
+
+
+def place_market_order(client, token_id: str, amount: float) -> dict:
+    """Build, sign and post a FOK market BUY for `amount` USDC of `token_id`."""
+    args   = MarketOrderArgs(token_id=token_id, amount=amount, side=BUY)
+    poly_acquire("/book")    # market orders price off the book
+    signed = client.create_market_order(args)
+    poly_acquire("/order")
+    return client.post_order(signed, OrderType.FOK)
+
+
 # ─────────────────────────────────────────────
 # FORMAT RESULTS
 # ─────────────────────────────────────────────
 
-def format_results(text: str, market_key: str) -> str:
-    config      = MARKET_CONFIGS[market_key]
-    word_groups = config["word_groups"]
-    thresh_map  = config.get("thresholds", {})
-    default_th  = config.get("default_threshold", 1)
-    slug        = config["slug"]
-    match_fn    = MARKET_MATCHERS[config["match_market"]]
-    is_testing  = config.get("testing", False)
-
-    thresholds = {cat: thresh_map.get(cat, default_th) for cat in word_groups}
-    text_lower = text.lower()
-    counts     = {cat: count_matches(text_lower, spec) for cat, spec in word_groups.items()}
-    sorted_cnt = dict(sorted(counts.items()))
-    total      = sum(sorted_cnt.values())
-
-    msg = f"<b>📊 Word Counts — {config['label']}</b>\n<pre>"
-    for cat, count in sorted_cnt.items():
-        thresh = thresholds.get(cat, 1)
-        if count >= thresh:
-            msg += f"{cat:<28} {count:>4} ✅\n"
-        elif count > 0:
-            msg += f"{cat:<28} {count:>4} ❌\n"
-        else:
-            msg += f"{cat:<28} {count:>4} ➖\n"
-    msg += f"{'─'*34}\nTOTAL: {total}\n</pre>"
+def start_polymarket_fetch(market_key: str) -> Future | None:
+    """Kick off the (network-bound) Polymarket lookup; None for test markets."""
+    config = MARKET_CONFIGS[market_key]
+    if config.get("testing", False):
+        return None
+    return EXECUTOR.submit(get_polymarket_data, config["slug"],
+                           MARKET_MATCHERS[config["match_market"]], config["word_groups"])
 
-    if is_testing:
-        return f"<b>🧪 TEST MODE — {config['label']}</b>\n\n{msg}\n<i>No Polymarket trades (testing only).</i>"
 
-    prices, token_ids = get_polymarket_data(slug, match_fn, word_groups)
+COUNTS_CACHE_SIZE = 64
+_counts_cache: dict[tuple[str, bytes], dict[str, int]] = {}   # (market, digest) → counts, oldest first
+_counts_cache_lock = threading.Lock()
 
-    tradeable, no_token, no_market = [], [], []
 
-    for cat, count in sorted_cnt.items():
-        thresh  = thresholds.get(cat, 1)
-        yes_p   = prices.get(cat) if prices else None
+def count_transcript(text: str, market_key: str, lowered: bool = False) -> dict[str, int]:
+    """
+    lowered=True means `text` is already lower-case and is scanned as-is.
+    Counts are memoised on a digest of the text, so a re-sent transcript
+    skips lowering and scanning.
+    """
+    key = (market_key, hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest())
+    with _counts_cache_lock:
+        hit = _counts_cache.pop(key, None)
+        if hit is not None:
+            _counts_cache[key] = hit                 # move to newest
+            return dict(hit)
+
+    # Auto-generated captions are often already lower-case; for ASCII text
+    # islower() proves lower() would be a no-op, so skip the full-size copy.
+    if lowered or (text.isascii() and text.islower()):
+        text_lower = text
+    else:
+        text_lower = text.lower()
+    prefilter = literal_prefilter_ok(text_lower)
+    counts    = count_categories(text_lower, COMPILED_GROUPS[market_key], prefilter)
+
+    with _counts_cache_lock:
+        _counts_cache[key] = counts
+        if len(_counts_cache) > COUNTS_CACHE_SIZE:
+            del _counts_cache[next(iter(_counts_cache))]
+    return dict(counts)
+
+
+def _count_line(label: str, count: int, thresh: int) -> str:
+    mark = "✅" if count >= thresh else "❌" if count > 0 else "➖"
+    return f"{label} {count:>4} {mark}\n"
+
+
+def format_counts(market_key: str, counts: dict[str, int]) -> str:
+    """Just the word-count table, sent while Polymarket data is still loading."""
+    config = MARKET_CONFIGS[market_key]
+    rows   = CATEGORY_ROWS[market_key]
+    return "".join([
+        f"<b>📊 Word Counts — {config['label']}</b>\n<pre>",
+        *(_count_line(label, counts[cat], thresh) for cat, label, thresh in rows),
+        f"{'─'*34}\nTOTAL: {sum(counts.values())}\n</pre>",
+    ])
+
+
+def render_results(market_key: str, counts: dict[str, int], poly_data: tuple) -> str:
+    """Count table + Polymarket outcomes, placing trades when AUTO_TRADE is on."""
+    config     = MARKET_CONFIGS[market_key]
+    rows       = CATEGORY_ROWS[market_key]
+    is_testing = config.get("testing", False)
+    total      = sum(counts.values())
+
+    # The table and the trade candidates come from one pass over the rows
+    prices, token_ids = poly_data
+    price_of  = prices.get    if prices    else {}.get    # bound once, not per row
+    tokens_of = token_ids.get if token_ids else {}.get
+
+    msg_parts = [f"<b>📊 Word Counts — {config['label']}</b>\n<pre>"]
+    tradeable, no_token, no_market = [], [], []
+    for cat, label, thresh in rows:
+        count = counts[cat]
+        msg_parts.append(_count_line(label, count, thresh))
 
+        yes_p = price_of(cat)
         if yes_p is None:
             no_market.append(cat)
             continue
 
-        no_p    = 1.0 - yes_p
-        tokens  = token_ids.get(cat, {})
-        yes_tok = tokens.get("yes")
-        no_tok  = tokens.get("no")
-
         if count >= thresh:
-            side, p, tok = "Yes", yes_p, yes_tok
+            side, p, tok = "Yes", yes_p,       tokens_of(cat, {}).get("yes")
         else:
-            side, p, tok = "No",  no_p,  no_tok
+            side, p, tok = "No",  1.0 - yes_p, tokens_of(cat, {}).get("no")
 
         if p < 0.95:
             edge = int((1.0 - p) / p * 100) if p > 0 else 999
@@ -851,74 +1635,49 @@ def format_results(text: str, market_key: str) -> str:
                 no_token.append((cat, side, p, edge))
         else:
             no_token.append((cat, side, p, 0))
+    msg_parts.append(f"{'─'*34}\nTOTAL: {total}\n</pre>")
+    msg = "".join(msg_parts)
+
+    if is_testing:
+        return f"<b>🧪 TEST MODE — {config['label']}</b>\n\n{msg}\n<i>No Polymarket trades (testing only).</i>"
 
     total_shown = len(tradeable) + len(no_token) + len(no_market)
-    poly_section = f"\n<b>🎯 All {total_shown} outcomes ({len(tradeable)} tradeable)</b>"
+    poly_parts  = [f"\n<b>🎯 All {total_shown} outcomes ({len(tradeable)} tradeable)</b>"]
 
     if tradeable:
-        poly_section += "\n<pre>"
+        poly_parts.append("\n<pre>")
         for cat, side, _, price, edge in tradeable:
-            poly_section += f"{cat:<28} {side:<4} {price:.2f}  ~{edge}%\n"
-        poly_section += "</pre>"
+            poly_parts.append(f"{cat:<28} {side:<4} {price:.2f}  ~{edge}%\n")
+        poly_parts.append("</pre>")
 
     if no_token:
-        poly_section += "\n<b>⚠️ No token (price known):</b>\n<pre>"
+        poly_parts.append("\n<b>⚠️ No token (price known):</b>\n<pre>")
         for cat, side, price, edge in no_token:
-            poly_section += f"{cat:<28} {side:<4} {price:.2f}  ~{edge}%\n"
-        poly_section += "</pre>"
+            poly_parts.append(f"{cat:<28} {side:<4} {price:.2f}  ~{edge}%\n")
+        poly_parts.append("</pre>")
 
     if no_market:
-        poly_section += f"\n<b>❓ No market data:</b> {', '.join(no_market)}"
+        poly_parts.append(f"\n<b>❓ No market data:</b> {', '.join(no_market)}")
 
     opportunities = tradeable
 
     trade_results = []
     if AUTO_TRADE and PRIVATE_KEY and opportunities:
-        import datetime
-        def _ist() -> str:
-            utc = datetime.datetime.utcnow()
-            ist = utc + datetime.timedelta(hours=5, minutes=30)
-            return ist.strftime("%H:%M:%S IST")
-
         actual_amt = max(TRADE_AMOUNT, MIN_TRADE_AMOUNT)
-        t_trades_start = _ist()
+        t_trades_start = ist_clock()
         try:
-            pk     = PRIVATE_KEY[2:] if PRIVATE_KEY.startswith("0x") else PRIVATE_KEY
-            client = ClobClient(
-                host="https://clob.polymarket.com",
-                chain_id=137,
-                key=pk,
-                signature_type=1,
-                funder=WALLET_ADDRESS or None,
-            )
-            client.set_api_creds(client.create_or_derive_api_creds())
-            for cat, side, tok, price, edge in opportunities:
-                try:
-                    t_before = datetime.datetime.utcnow()
-                    args     = MarketOrderArgs(token_id=tok, amount=actual_amt, side=BUY)
-                    signed   = client.create_market_order(args)
-                    resp     = client.post_order(signed, OrderType.FOK)
-                    t_after  = datetime.datetime.utcnow()
-                    elapsed  = (t_after - t_before).total_seconds()
-                    trade_ts = _ist()
-                    status   = resp.get("status", "")
-                    if resp.get("order_id") or resp.get("success") or status in ("matched","live","open"):
-                        trade_results.append(f"✅ {cat[:16]:<16} {side}  ${actual_amt}  @{trade_ts}  ({elapsed:.2f}s)")
-                    else:
-                        trade_results.append(f"⚠️ {cat[:16]:<16} {side}  No fill  @{trade_ts}  ({elapsed:.2f}s)")
-                    time.sleep(0.5)
-                except Exception as ex:
-                    trade_results.append(f"❌ {cat[:16]:<16} {side}  Error: {str(ex)[:40]}  @{_ist()}")
-                    time.sleep(0.5)
+            get_clob_client()
+            futures = [TRADE_POOL.submit(place_trade, cat, side, tok, actual_amt)
+                       for cat, side, tok, _, _ in opportunities]
+            trade_results = [f.result() for f in futures]
         except Exception as e:
             trade_results.append(f"❌ Setup failed: {str(e)[:60]}")
 
-    result = f"<b>Polymarket Sniper 🚀</b>\n\n{msg}{poly_section}"
     if trade_results:
-        result += f"\n\n<b>🤖 Trades (${max(TRADE_AMOUNT, MIN_TRADE_AMOUNT)}) — started {t_trades_start}</b>\n<pre>"
-        result += "\n".join(trade_results[:25])
-        result += "</pre>"
-    return result
+        poly_parts.append(f"\n\n<b>🤖 Trades (${actual_amt}) — started {t_trades_start}</b>\n<pre>")
+        poly_parts.append("\n".join(trade_results[:25]))
+        poly_parts.append("</pre>")
+    return "".join(["<b>Polymarket Sniper 🚀</b>\n\n", msg, *poly_parts])
 
 
 # ─────────────────────────────────────────────
@@ -927,7 +1686,6 @@ def format_results(text: str, market_key: str) -> str:
 
 def monitor_channel(chat_id: int, market_key: str, stop_event: threading.Event):
     import datetime
-    import traceback
 
     def ist_now() -> str:
         utc = datetime.datetime.utcnow()
@@ -942,22 +1700,23 @@ def monitor_channel(chat_id: int, market_key: str, stop_event: threading.Event):
         # FIX #6: read skip_mma flag from config (defaults False for non-JRE markets)
         skip_mma   = config.get("skip_mma", False)
 
-        log(f"[Monitor] Thread started — market={market_key} channel={channel_id} chat={chat_id} skip_mma={skip_mma}")
+        log("[Monitor] Thread started — market=%s channel=%s chat=%s skip_mma=%s",
+            market_key, channel_id, chat_id, skip_mma)
 
         if not YT_KEYS.available:
             msg = "❌ No YouTube API keys available. Cannot monitor."
-            log(f"[Monitor] {msg}")
+            log("[Monitor] %s", msg)
             bot.send_message(chat_id, msg)
             return
 
-        log(f"[Monitor] Seeding videoCount…")
+        log("[Monitor] Seeding videoCount…")
         last_count = get_video_count(channel_id, chat_id=chat_id)
 
-        log(f"[Monitor] Seeding latest video ID…")
+        log("[Monitor] Seeding latest video ID…")
         seed_vid = get_latest_video(channel_id, chat_id=chat_id, skip_mma=skip_mma)
         last_vid_id = seed_vid["video_id"] if seed_vid else None
 
-        log(f"[Monitor] Seed — videoCount={last_count}  latest={last_vid_id}")
+        log("[Monitor] Seed — videoCount=%s  latest=%s", last_count, last_vid_id)
 
         bot.send_message(
             chat_id,
@@ -987,14 +1746,14 @@ def monitor_channel(chat_id: int, market_key: str, stop_event: threading.Event):
                 new_count = get_video_count(channel_id, chat_id=chat_id)
 
                 if new_count is None:
-                    log(f"[Monitor] Poll #{poll_count} — videoCount API failed")
+                    log("[Monitor] Poll #%d — videoCount API failed", poll_count)
                     if not YT_KEYS.available:
                         log("[Monitor] All keys exhausted — stopping monitor.")
                         stop_event.set()
                         break
                     continue
 
-                log(f"[Monitor] Poll #{poll_count} — count={new_count} (was {last_count})")
+                log("[Monitor] Poll #%d — count=%s (was %s)", poll_count, new_count, last_count)
 
                 if last_count is not None and new_count <= last_count:
                     continue
@@ -1004,7 +1763,7 @@ def monitor_channel(chat_id: int, market_key: str, stop_event: threading.Event):
 
                 t_detected = ist_now()
                 diff = (new_count - last_count) if last_count else 1
-                log(f"[Monitor] 🆕 videoCount {last_count}→{new_count} (+{diff}) at {t_detected}")
+                log("[Monitor] 🆕 videoCount %s→%s (+%s) at %s", last_count, new_count, diff, t_detected)
 
                 bot.send_message(
                     chat_id,
@@ -1018,7 +1777,7 @@ def monitor_channel(chat_id: int, market_key: str, stop_event: threading.Event):
                 latest = get_latest_video(channel_id, chat_id=chat_id, skip_mma=skip_mma)
 
                 if latest is None:
-                    log(f"[Monitor] ⚠️  get_latest_video returned None")
+                    log("[Monitor] ⚠️  get_latest_video returned None")
                     bot.send_message(
                         chat_id,
                         f"⚠️ Count increased but couldn't identify the new non-Short"
@@ -1034,7 +1793,7 @@ def monitor_channel(chat_id: int, market_key: str, stop_event: threading.Event):
                 title  = latest["title"]
 
                 if vid_id == last_vid_id:
-                    log(f"[Monitor] ⚠️  Same vid as before ({vid_id}) — likely a Short/MMA was uploaded")
+                    log("[Monitor] ⚠️  Same vid as before (%s) — likely a Short/MMA was uploaded", vid_id)
                     bot.send_message(
                         chat_id,
                         f"⚠️ Count +1 but latest eligible video is unchanged: <code>{vid_id}</code>\n"
@@ -1046,7 +1805,7 @@ def monitor_channel(chat_id: int, market_key: str, stop_event: threading.Event):
                     break
 
                 t_video_detected = ist_now()
-                log(f"[Monitor] ✅ New video confirmed: {vid_id} | {title}")
+                log("[Monitor] ✅ New video confirmed: %s | %s", vid_id, title)
 
                 bot.send_message(
                     chat_id,
@@ -1067,12 +1826,13 @@ def monitor_channel(chat_id: int, market_key: str, stop_event: threading.Event):
                 t_tr_start = datetime.datetime.utcnow()
                 transcript = None
                 for attempt in range(1, TRANSCRIPT_RETRIES + 1):
+                    prefetch_polymarket(market_key)   # overlaps the transcript request
                     transcript = fetch_transcript(vid_id)
                     if transcript:
                         break
                     if attempt < TRANSCRIPT_RETRIES:
-                        log(f"[Monitor] Transcript not ready (attempt {attempt}/{TRANSCRIPT_RETRIES}). "
-                            f"Waiting {TRANSCRIPT_RETRY_GAP}s...")
+                        log("[Monitor] Transcript not ready (attempt %d/%d). Waiting %ss...",
+                            attempt, TRANSCRIPT_RETRIES, TRANSCRIPT_RETRY_GAP)
                         bot.send_message(
                             chat_id,
                             f"⏳ Transcript not ready yet (attempt {attempt}/{TRANSCRIPT_RETRIES}).\n"
@@ -1084,7 +1844,7 @@ def monitor_channel(chat_id: int, market_key: str, stop_event: threading.Event):
                 tr_secs  = (t_tr_end - t_tr_start).total_seconds()
 
                 if not transcript:
-                    log(f"[Monitor] Transcript unavailable after {TRANSCRIPT_RETRIES} attempts for {vid_id}")
+                    log("[Monitor] Transcript unavailable after %d attempts for %s", TRANSCRIPT_RETRIES, vid_id)
                     bot.send_message(
                         chat_id,
                         f"⚠️ <b>Transcript unavailable after {TRANSCRIPT_RETRIES} attempts</b>\n"
@@ -1097,10 +1857,14 @@ def monitor_channel(chat_id: int, market_key: str, stop_event: threading.Event):
                     break
 
                 t_tr_done = ist_now()
-                log(f"[Monitor] ✅ Transcript fetched in {tr_secs:.1f}s ({len(transcript):,} chars)")
+                log("[Monitor] ✅ Transcript fetched in %.1fs (%s chars)", tr_secs, format(len(transcript), ","))
 
                 t_an_start = datetime.datetime.utcnow()
-                result     = format_results(transcript, market_key)
+                # Polymarket fetch is network-bound — start it so it overlaps the scan
+                poly_future = start_polymarket_fetch(market_key)
+                counts      = count_transcript(transcript, market_key)
+                result      = render_results(market_key, counts,
+                                             poly_future.result() if poly_future else (None, None))
                 t_an_end   = datetime.datetime.utcnow()
                 an_secs    = (t_an_end - t_an_start).total_seconds()
                 total_secs = (t_an_end - t_tr_start).total_seconds()
@@ -1118,19 +1882,13 @@ def monitor_channel(chat_id: int, market_key: str, stop_event: threading.Event):
                     f"</pre>"
                 )
 
-                # Split into two messages to avoid Telegram 4096 char limit
-                try:
-                    bot.send_message(chat_id, result, parse_mode="HTML")
-                except Exception as msg_err:
-                    log(f"[Monitor] Message too long, sending in parts: {msg_err}")
-                    bot.send_message(chat_id, msg, parse_mode="HTML")
-                    if poly_section:
-                        bot.send_message(chat_id, poly_section, parse_mode="HTML")
+                # Falls back to two messages past Telegram's 4096 char limit
+                send_results(chat_id, market_key, counts, result)
                 try:
                     bot.send_message(chat_id, timing_footer, parse_mode="HTML")
                 except Exception:
                     pass
-                log(f"[Monitor] ✅ Done. Pipeline: {total_secs:.1f}s")
+                log("[Monitor] ✅ Done. Pipeline: %.1fs", total_secs)
 
                 bot.send_message(
                     chat_id,
@@ -1142,7 +1900,7 @@ def monitor_channel(chat_id: int, market_key: str, stop_event: threading.Event):
 
             except Exception as e:
                 tb = traceback.format_exc()
-                log(f"[Monitor] ❌ Exception in poll #{poll_count}: {e}\n{tb}")
+                log("[Monitor] ❌ Exception in poll #%d: %s\n%s", poll_count, e, tb)
                 try:
                     bot.send_message(
                         chat_id,
@@ -1162,11 +1920,11 @@ def monitor_channel(chat_id: int, market_key: str, stop_event: threading.Event):
                 parse_mode="HTML",
             )
         state["mode"] = "awaiting_link"
-        log(f"[Monitor] Thread exited for chat {chat_id}.")
+        log("[Monitor] Thread exited for chat %s.", chat_id)
 
     except Exception as fatal:
         tb = traceback.format_exc()
-        log(f"[Monitor] 💀 FATAL crash: {fatal}\n{tb}")
+        log("[Monitor] 💀 FATAL crash: %s\n%s", fatal, tb)
         try:
             import datetime
             utc = datetime.datetime.utcnow()
@@ -1370,6 +2128,111 @@ def handle_callback(call: types.CallbackQuery):
 # TEXT HANDLER
 # ─────────────────────────────────────────────
 
+def reply_with_results(chat_id: int, text: str, market_key: str, lowered: bool = False):
+    """
+    Send the word counts as soon as they're ready; the Polymarket section
+    and any trades are filled in afterwards by editing that same message,
+    on the executor thread, so the handler thread isn't held by the network.
+    """
+    poly_future = start_polymarket_fetch(market_key)
+    counts      = count_transcript(text, market_key, lowered)
+    if poly_future is None or poly_future.done():
+        poly_data = poly_future.result() if poly_future else (None, None)
+        try:
+            send_results(chat_id, market_key, counts, render_or_notice(market_key, counts, poly_data))
+        except Exception as e:
+            log("[Bot] ❌ Could not send results: %s", e)
+        return
+
+    sent = bot.send_message(
+        chat_id,
+        f"<b>Polymarket Sniper 🚀</b>\n\n{format_counts(market_key, counts)}\n⏳ <i>Fetching Polymarket…</i>",
+        parse_mode="HTML",
+    )
+
+    def finish(fut: Future):
+        try:
+            poly_data = fut.result()
+        except Exception as e:
+            log("[Poly] ❌ Background fetch failed: %s", e)
+            poly_data = (None, None)
+        result = render_or_notice(market_key, counts, poly_data)  # may place trades: render once
+        try:
+            bot.edit_message_text(result, chat_id, sent.message_id, parse_mode="HTML")
+        except Exception as e:
+            # Too long, deleted or rate-limited: don't leave the user on
+            # "Fetching…" with trades reported only in the log.
+            log("[Bot] ❌ Could not update results message (%s) — sending it instead", e)
+            try:
+                send_results(chat_id, market_key, counts, result)
+            except Exception as e:
+                log("[Bot] ❌ Could not send results: %s", e)
+
+    poly_future.add_done_callback(finish)
+
+
+def render_or_notice(market_key: str, counts: dict[str, int], poly_data: tuple) -> str:
+    """render_results, or the count table with a failure note if rendering raises."""
+    try:
+        return render_results(market_key, counts, poly_data)
+    except Exception as e:
+        log("[Bot] ❌ Could not build results: %s", e)
+        return (f"<b>Polymarket Sniper 🚀</b>\n\n{format_counts(market_key, counts)}\n"
+                f"❌ <i>Could not build the Polymarket section — see the bot log.</i>")
+
+
+TELEGRAM_MSG_LIMIT = 4096
+
+
+def split_message(text: str, limit: int = TELEGRAM_MSG_LIMIT) -> list[str]:
+    """
+    Split HTML text into messages of at most `limit` chars on line
+    boundaries, closing and reopening <pre> around each cut so every part
+    still parses.  A single line longer than a message is hard-cut.
+    """
+    parts, cur, in_pre = [], "", False
+    for line in text.splitlines(keepends=True):
+        opened, closed = line.rfind("<pre>"), line.rfind("</pre>")
+        while True:
+            tail = "</pre>" if in_pre else ""
+            if len(cur) + len(line) + len(tail) <= limit:
+                break
+            if cur.strip() not in ("", "<pre>"):
+                parts.append(cur + tail)
+                cur = "<pre>" if in_pre else ""
+                continue
+            room = limit - len(cur) - len(tail)
+            parts.append(cur + line[:room] + tail)
+            cur, line = ("<pre>" if in_pre else ""), line[room:]
+        cur += line
+        if opened != closed:                     # both -1 when the line has no tag
+            in_pre = opened > closed
+    if cur.strip():
+        parts.append(cur)
+    return parts
+
+
+def send_results(chat_id: int, market_key: str, counts: dict[str, int], result: str):
+    """
+    Send a rendered result; if Telegram rejects it (e.g. over the 4096-char
+    limit), send the count table and the Polymarket/trade section separately,
+    split under the limit.  Failures are logged, never raised.
+    """
+    try:
+        bot.send_message(chat_id, result, parse_mode="HTML")
+        return
+    except Exception as e:
+        log("[Bot] Results message rejected (%s) — sending in parts", e)
+    table = format_counts(market_key, counts)
+    _, found, rest = result.partition(table)
+    parts = split_message(table) + split_message(rest.strip()) if found else split_message(result)
+    for part in parts:
+        try:
+            bot.send_message(chat_id, part, parse_mode="HTML")
+        except Exception as e:
+            log("[Bot] ❌ Could not send results part: %s", e)
+
+
 @bot.message_handler(content_types=["text"])
 def handle_text(message: types.Message):
     chat_id   = message.chat.id
@@ -1405,8 +2268,7 @@ def handle_text(message: types.Message):
     else:
         transcript = user_text
 
-    result = format_results(transcript, market_key)
-    bot.send_message(chat_id, result, parse_mode="HTML")
+    reply_with_results(chat_id, transcript, market_key)
 
 
 # ─────────────────────────────────────────────
@@ -1431,9 +2293,21 @@ def handle_document(message: types.Message):
     try:
         file_info  = bot.get_file(doc.file_id)
         downloaded = bot.download_file(file_info.file_path)
-        transcript = downloaded.decode("utf-8", errors="replace")
-        result     = format_results(transcript, state["market_key"])
-        bot.send_message(chat_id, result, parse_mode="HTML")
+        # Each step rebinds or drops the previous buffer, so at most two
+        # copies of the file are alive at once and only the text is held
+        # while counting.
+        if downloaded.isascii():
+            # Common case: bytes.lower() folds ASCII in one C pass, so the
+            # decoded text needs no separate Unicode lower() copy.
+            if not downloaded.islower():
+                downloaded = downloaded.lower()
+            transcript = downloaded.decode("ascii")
+            del downloaded
+            reply_with_results(chat_id, transcript, state["market_key"], lowered=True)
+        else:
+            transcript = downloaded.decode("utf-8", errors="replace")
+            del downloaded
+            reply_with_results(chat_id, transcript, state["market_key"])
     except Exception as e:
         bot.reply_to(message, f"❌ Error: {str(e)}")
 
@@ -1452,20 +2326,28 @@ def _midnight_reset_loop():
         time.sleep(secs)
         YT_KEYS.reset_exhausted()
 
-threading.Thread(target=_midnight_reset_loop, daemon=True).start()
-
 
 # ─────────────────────────────────────────────
 # STARTUP
 # ─────────────────────────────────────────────
 
-print("Bot starting…")
-print(f"  Markets: {', '.join(MARKET_CONFIGS.keys())}")
-print(f"  AUTO_TRADE:    {AUTO_TRADE}")
-print(f"  TRADE_AMOUNT:  ${max(TRADE_AMOUNT, MIN_TRADE_AMOUNT)}")
-print(f"  POLL_INTERVAL: {POLL_INTERVAL}s")
-print(f"  YouTube API:   {'✅ ' + YT_KEYS.status() if YT_KEYS.available else '❌ NOT SET'}")
-print(f"  Transcript API:{'✅' if API_TOKEN else '❌ NOT SET'}")
-print(f"  Wallet:        {(WALLET_ADDRESS[:10] + '…') if WALLET_ADDRESS else 'Not set'}")
+def main():
+    threading.Thread(target=_midnight_reset_loop, daemon=True).start()
+
+    print("Bot starting…")
+    print(f"  Markets: {', '.join(MARKET_CONFIGS.keys())}")
+    print(f"  AUTO_TRADE:    {AUTO_TRADE}")
+    print(f"  TRADE_AMOUNT:  ${max(TRADE_AMOUNT, MIN_TRADE_AMOUNT)}")
+    print(f"  POLL_INTERVAL: {POLL_INTERVAL}s")
+    print(f"  YouTube API:   {'✅ ' + YT_KEYS.status() if YT_KEYS.available else '❌ NOT SET'}")
+    print(f"  Transcript API:{'✅' if API_TOKEN else '❌ NOT SET'}")
+    print(f"  Wallet:        {(WALLET_ADDRESS[:10] + '…') if WALLET_ADDRESS else 'Not set'}")
+
+    if AUTO_TRADE and PRIVATE_KEY:
+        EXECUTOR.submit(_prewarm_clob_client)
+
+    bot.infinity_polling(skip_pending=True)
+
 
-bot.infinity_polling()
+if __name__ == "__main__":
+    main()